@@ -1,20 +1,29 @@
 import sys
+import errno
 import logging
+import re
 import msgspec
+import queue
+from collections import deque
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QTextEdit, QListWidget, QListWidgetItem,
+    QPushButton, QLabel, QPlainTextEdit, QListWidget, QListWidgetItem,
     QFileDialog, QMessageBox
 )
-from PySide6.QtCore import Qt, QTimer, QSize, QObject, Signal
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, QTimer, QSize, QObject, QRunnable, QThread, QThreadPool, Signal
+from PySide6.QtGui import QIcon, QPixmap
 
 from src.client import ReyerClient, ClientConfig
+from src.launcher_dialog import LauncherDialog
 from src.protocol_builder import ProtocolBuilderDialog
-from src.messages import Command, ProtocolRequest, BroadcastTopic, ProtocolEvent, ProtocolEventMessage, RuntimeState
-from src.protocol_storage import ProtocolStorage
+from src.messages import (
+    Command, ProtocolRequest, BroadcastTopic, ProtocolEvent, ProtocolEventMessage, RuntimeState,
+    serialize_message,
+)
+from src.protocol_storage import safe_filename
 
 # Configure logging
 logging.basicConfig(
@@ -23,39 +32,275 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Protocol files are MessagePack (default) or JSON, chosen by extension
+_PROTOCOL_ENCODER = msgspec.msgpack.Encoder()
+_PROTOCOL_DECODER = msgspec.msgpack.Decoder(ProtocolRequest)
+_PROTOCOL_JSON_ENCODER = msgspec.json.Encoder()
+_PROTOCOL_JSON_DECODER = msgspec.json.Decoder(ProtocolRequest)
+_JSON_OBJECT_START = re.compile(rb"\s*\{")
+
+
+def _decode_protocol(data: bytes, file_path: str) -> ProtocolRequest:
+    """Decode a protocol file by extension, sniffing JSON by its leading '{' otherwise."""
+    lower = file_path.lower()
+    if lower.endswith('.msgpack'):
+        return _PROTOCOL_DECODER.decode(data)
+    if lower.endswith('.json') or _JSON_OBJECT_START.match(data):
+        return _PROTOCOL_JSON_DECODER.decode(data)
+    return _PROTOCOL_DECODER.decode(data)
+
+
+def _encode_protocol(protocol: ProtocolRequest, file_path: str) -> bytes:
+    """Encode a protocol as JSON for .json paths, MessagePack otherwise."""
+    if file_path.lower().endswith('.json'):
+        return _PROTOCOL_JSON_ENCODER.encode(protocol)
+    return _PROTOCOL_ENCODER.encode(protocol)
+
+
+class HistoryEntry(msgspec.Struct, gc=False):
+    """A protocol sent during this session."""
+    protocol: ProtocolRequest
+    encoded: bytes  # Request as sent, reused on resend
+    display_text: str  # "name (participant_id) - HH:MM:SS"
+
+
+class _ProtocolState(msgspec.Struct):
+    """State of the protocol currently loaded on the server."""
+    uuid: str | None = None
+    name: str | None = None
+    protocol: ProtocolRequest | None = None
+    task_index: int = 0
+    total_tasks: int = 0
+
 
 class ConnectionSignals(QObject):
     """Emits signals for pipe connection events."""
     connected = Signal()
     disconnected = Signal()
+    protocol_events_ready = Signal()  # Events queued in _pending_events
+
+
+class FileIoSignals(QObject):
+    """Emits results of protocol file I/O done on the thread pool."""
+    loaded = Signal(object)  # ProtocolRequest
+    load_failed = Signal(str)
+    saved = Signal(str)  # file path
+    save_failed = Signal(str)
+
+
+class _LoadProtocolRunnable(QRunnable):
+    """Reads and decodes a protocol file."""
+
+    def __init__(self, file_path: str, signals: FileIoSignals):
+        super().__init__()
+        self._file_path = file_path
+        self._signals = signals
+
+    def run(self):
+        try:
+            protocol = _decode_protocol(Path(self._file_path).read_bytes(), self._file_path)
+        except Exception as e:
+            self._signals.load_failed.emit(str(e))
+            return
+        self._signals.loaded.emit(protocol)
+
+
+class _SaveProtocolRunnable(QRunnable):
+    """Encodes a protocol and writes it to a file."""
+
+    def __init__(self, protocol: ProtocolRequest, file_path: str, signals: FileIoSignals):
+        super().__init__()
+        self._protocol = protocol
+        self._file_path = file_path
+        self._signals = signals
+
+    def run(self):
+        try:
+            data = _encode_protocol(self._protocol, self._file_path)
+            with open(self._file_path, 'wb') as f:
+                f.write(data)
+        except (msgspec.EncodeError, TypeError) as e:
+            logger.exception("Failed to encode protocol for %s", self._file_path)
+            self._signals.save_failed.emit(f"to {self._file_path}: {e}")
+            return
+        except OSError as e:
+            code = errno.errorcode.get(e.errno, e.errno)
+            logger.exception("Failed to save protocol to %s", self._file_path)
+            # Name the file; the failure can surface after the user moved on
+            path = e.filename or self._file_path
+            self._signals.save_failed.emit(f"to {path} ({code}): {e.strerror or e}")
+            return
+        self._signals.saved.emit(self._file_path)
+
+
+class ProtocolSendWorker(QThread):
+    """Sends queued protocols to the server off the GUI thread."""
+    send_result = Signal(object, bytes, bool, bool)  # ProtocolRequest, encoded request, success, resend
+
+    def __init__(self, client: ReyerClient, parent=None):
+        super().__init__(parent)
+        self._client = client
+        self._queue: queue.Queue[tuple[ProtocolRequest, bytes | None, bool] | None] = queue.Queue()
+
+    def enqueue(self, protocol: ProtocolRequest, encoded: bytes | None = None, resend: bool = False):
+        """Queue a protocol to be sent, reusing its encoded request if given."""
+        self._queue.put((protocol, encoded, resend))
+
+    def stop(self, timeout_ms: int = 500) -> bool:
+        """
+        Drop queued sends and stop the thread once the current send finishes.
+
+        Returns:
+            True if the thread stopped within timeout_ms
+        """
+        # Each queued send could wait out the client's receive timeout, so
+        # don't hold shutdown behind them
+        dropped = 0
+        try:
+            while True:
+                self._queue.get_nowait()
+                dropped += 1
+        except queue.Empty:
+            pass
+        if dropped:
+            logger.info("Dropped %d queued protocol sends", dropped)
+        self._queue.put(None)
+        return self.wait(timeout_ms)
+
+    def run(self):
+        while (item := self._queue.get()) is not None:
+            protocol, encoded, resend = item
+            if encoded is None:
+                encoded = serialize_message(protocol)
+            success = self._client.send_encoded_protocol(encoded)
+            self.send_result.emit(protocol, encoded, success, resend)
 
 
 class ReyerMainWindow(QMainWindow):
     """Main window for the Reyer PySide6 application."""
 
+    HISTORY_LIMIT = 500  # Maximum number of protocols kept in the history list
+
+    _ASSETS_DIR = Path(__file__).parent / "assets" / "icons"
+    _ICON_CACHE: dict[str, QIcon] = {}
+    _STATUS_PIXMAP_CACHE: dict[str, QPixmap] = {}
+
+    # Window stylesheet, set once on the central widget; buttons opt in
+    # through their object name (protocol, ctrl, start)
+    _WINDOW_QSS = """
+        QPushButton#protocol, QPushButton#ctrl {
+            background-color: #f0f0f0;
+            border-radius: 6px;
+            border: none;
+        }
+        QPushButton#protocol {
+            padding: 8px 16px;
+            font-weight: bold;
+            color: #000;
+        }
+        QPushButton#protocol:hover, QPushButton#ctrl:hover {
+            background-color: #e0e0e0;
+        }
+        QPushButton#protocol:pressed, QPushButton#ctrl:pressed {
+            background-color: #d0d0d0;
+        }
+        QPushButton#protocol:disabled, QPushButton#ctrl:disabled {
+            background-color: #f5f5f5;
+            color: #ccc;
+        }
+        QPushButton#start {
+            background-color: #4CAF50;
+            border-radius: 26px;
+            border: none;
+        }
+        QPushButton#start:hover {
+            background-color: #45a049;
+        }
+        QPushButton#start:pressed {
+            background-color: #3d8b40;
+        }
+        QPushButton#start:disabled {
+            background-color: #ccc;
+        }
+    """
+
     def __init__(self):
         super().__init__()
         self.client: ReyerClient = None
-        self.assets_dir = Path(__file__).parent / "assets" / "icons"
         self.connection_signals = ConnectionSignals()
-        self.protocol_storage = ProtocolStorage()
-        self.protocol_history: list[dict] = []  # History of sent protocols
+        self.file_io_signals = FileIoSignals()
+        # History of sent protocols, most recent first
+        self.protocol_history: deque[HistoryEntry] = deque(maxlen=self.HISTORY_LIMIT)
+        # Latest history entry for each protocol UUID
+        self._history_by_uuid: dict[str, HistoryEntry] = {}
+        # Protocols queued on the send worker, oldest first
+        self._sends_in_flight: list[ProtocolRequest] = []
+        self._log_buffer: deque[str] = deque()  # Messages waiting for the next log flush
 
         # Protocol state tracking
-        self.current_protocol_uuid: str | None = None
-        self.current_protocol_name: str | None = None
-        self.current_protocol: ProtocolRequest | None = None
-        self.current_task_index: int = 0
-        self.total_tasks: int = 0
+        self.protocol_state = _ProtocolState()
+        # Protocol events handed over from the subscription thread; deque
+        # append/popleft are atomic, so producer and GUI consumer need no lock
+        self._pending_events: deque[ProtocolEventMessage] = deque()
+        self._event_drain_posted = False
+
+        # Connection state shown in the status bar (None until first drawn)
+        self._status_connected: bool | None = None
 
         # Graphics initialization state
         self.graphics_initialized = False
         self.runtime_state = RuntimeState.DEFAULT
+        # Launcher resources, fetched once per connection
+        self._launcher_bundle: dict | None = None
+        # Protocol file dialog, created on first use and shared by load/save
+        self._file_dialog: QFileDialog | None = None
+        self._last_protocol_dir = str(Path.cwd())
+        # Protocol builder, created on first use and reused per connection
+        self._builder_dialog: ProtocolBuilderDialog | None = None
+
+        # Protocol event dispatch table
+        self._event_handlers = {
+            ProtocolEvent.GRAPHICS_READY: self._on_graphics_ready,
+            ProtocolEvent.PROTOCOL_NEW: self._on_protocol_new,
+            ProtocolEvent.TASK_START: self._on_task_start,
+            ProtocolEvent.TASK_END: self._on_task_end,
+        }
 
         self.init_ui()
         self.init_client()
-        # Auto-connect on startup
-        QTimer.singleShot(100, self.auto_connect)
+        # Auto-connect once the event loop starts; connect() dials on its own
+        # thread, so no delay is needed to let the window show first
+        QTimer.singleShot(0, self.auto_connect)
+
+    @classmethod
+    def _icon(cls, name: str) -> QIcon:
+        """Return the cached QIcon for an SVG in the assets directory."""
+        icon = cls._ICON_CACHE.get(name)
+        if icon is None:
+            icon = cls._ICON_CACHE[name] = QIcon(str(cls._ASSETS_DIR / f"{name}.svg"))
+        return icon
+
+    @classmethod
+    def _status_pixmap(cls, name: str) -> QPixmap:
+        """Return the cached 24x24 rasterized status icon."""
+        pixmap = cls._STATUS_PIXMAP_CACHE.get(name)
+        if pixmap is None:
+            pixmap = cls._STATUS_PIXMAP_CACHE[name] = cls._icon(name).pixmap(QSize(24, 24))
+        return pixmap
+
+    def _make_tool_button(self, icon_name: str, tooltip: str, slot,
+                          object_name: str = "ctrl", icon_size: int = 24,
+                          size: int = 44) -> QPushButton:
+        """Create a disabled, fixed-size icon button."""
+        button = QPushButton()
+        button.setIcon(self._icon(icon_name))
+        button.setIconSize(QSize(icon_size, icon_size))
+        button.setToolTip(tooltip)
+        button.clicked.connect(slot)
+        button.setEnabled(False)
+        button.setFixedSize(size, size)
+        button.setObjectName(object_name)
+        return button
 
     def init_ui(self):
         """Initialize the user interface."""
@@ -64,6 +309,7 @@ class ReyerMainWindow(QMainWindow):
 
         # Central widget and layout
         central_widget = QWidget()
+        central_widget.setStyleSheet(self._WINDOW_QSS)
         self.setCentralWidget(central_widget)
 
         # Main horizontal layout: sidebar + content
@@ -84,44 +330,19 @@ class ReyerMainWindow(QMainWindow):
         # Status icon (circle-check or circle-x)
         self.status_icon = QLabel()
         self.status_icon.setFixedSize(24, 24)
-        # Set initial disconnected icon
-        icon = QIcon(str(self.assets_dir / "circle-x.svg"))
-        pixmap = icon.pixmap(QSize(24, 24))
-        self.status_icon.setPixmap(pixmap)
         status_layout.addWidget(self.status_icon)
 
         # Status text
-        self.status_label = QLabel("Disconnected")
-        self.status_label.setStyleSheet("font-weight: bold; padding: 10px; color: red;")
+        self.status_label = QLabel()
         status_layout.addWidget(self.status_label)
+        self._set_connection_status(False)
 
         status_layout.addStretch()
 
         # Exit button with power-off icon
-        self.exit_btn = QPushButton()
-        self.exit_btn.setIcon(QIcon(str(self.assets_dir / "power-off.svg")))
-        self.exit_btn.setIconSize(QSize(24, 24))
-        self.exit_btn.setToolTip("Exit")
-        self.exit_btn.clicked.connect(self.send_exit_command)
-        self.exit_btn.setEnabled(False)
-        self.exit_btn.setFixedSize(44, 44)
-        self.exit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f0f0f0;
-                border-radius: 6px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-            QPushButton:disabled {
-                background-color: #f5f5f5;
-                color: #ccc;
-            }
-        """)
+        self.exit_btn = self._make_tool_button(
+            "power-off", "Exit", partial(self._send_command, Command.EXIT)
+        )
         status_layout.addWidget(self.exit_btn)
 
         main_layout.addLayout(status_layout)
@@ -135,27 +356,7 @@ class ReyerMainWindow(QMainWindow):
         self.new_protocol_btn.clicked.connect(self.open_protocol_builder)
         self.new_protocol_btn.setEnabled(False)
         self.new_protocol_btn.setMaximumWidth(150)
-        button_style = """
-            QPushButton {
-                background-color: #f0f0f0;
-                border-radius: 6px;
-                border: none;
-                padding: 8px 16px;
-                font-weight: bold;
-                color: #000;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-            QPushButton:disabled {
-                background-color: #f5f5f5;
-                color: #ccc;
-            }
-        """
-        self.new_protocol_btn.setStyleSheet(button_style)
+        self.new_protocol_btn.setObjectName("protocol")
         protocol_buttons_layout.addWidget(self.new_protocol_btn)
 
         # Load Protocol button
@@ -163,7 +364,7 @@ class ReyerMainWindow(QMainWindow):
         self.load_protocol_btn.clicked.connect(self.load_and_send_protocol)
         self.load_protocol_btn.setEnabled(False)
         self.load_protocol_btn.setMaximumWidth(150)
-        self.load_protocol_btn.setStyleSheet(button_style)
+        self.load_protocol_btn.setObjectName("protocol")
         protocol_buttons_layout.addWidget(self.load_protocol_btn)
 
         protocol_buttons_layout.addStretch()
@@ -173,96 +374,35 @@ class ReyerMainWindow(QMainWindow):
         command_layout = QHBoxLayout()
         command_layout.addStretch()
 
-        # Control button stylesheet
-        control_btn_style = """
-            QPushButton {
-                background-color: #f0f0f0;
-                border-radius: 6px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-            QPushButton:disabled {
-                background-color: #f5f5f5;
-                color: #ccc;
-            }
-        """
-
-        # Start button style (larger with highlight)
-        start_btn_style = """
-            QPushButton {
-                background-color: #4CAF50;
-                border-radius: 26px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-            }
-        """
-
         # Start button with play icon (main control)
-        self.start_btn = QPushButton()
-        self.start_btn.setIcon(QIcon(str(self.assets_dir / "play.svg")))
-        self.start_btn.setIconSize(QSize(28, 28))
-        self.start_btn.setToolTip("Start")
-        self.start_btn.clicked.connect(self.send_start_command)
-        self.start_btn.setEnabled(False)
-        self.start_btn.setFixedSize(52, 52)
-        self.start_btn.setStyleSheet(start_btn_style)
+        self.start_btn = self._make_tool_button(
+            "play", "Start", partial(self._send_command, Command.START),
+            object_name="start", icon_size=28, size=52
+        )
         command_layout.addWidget(self.start_btn)
 
         # Previous button with arrow-left icon
-        self.previous_btn = QPushButton()
-        self.previous_btn.setIcon(QIcon(str(self.assets_dir / "arrow-left.svg")))
-        self.previous_btn.setIconSize(QSize(24, 24))
-        self.previous_btn.setToolTip("Previous")
-        self.previous_btn.clicked.connect(self.send_previous_command)
-        self.previous_btn.setEnabled(False)
-        self.previous_btn.setFixedSize(44, 44)
-        self.previous_btn.setStyleSheet(control_btn_style)
+        self.previous_btn = self._make_tool_button(
+            "arrow-left", "Previous", partial(self._send_command, Command.PREVIOUS)
+        )
         command_layout.addWidget(self.previous_btn)
 
         # Next button with arrow-right icon
-        self.next_btn = QPushButton()
-        self.next_btn.setIcon(QIcon(str(self.assets_dir / "arrow-right.svg")))
-        self.next_btn.setIconSize(QSize(24, 24))
-        self.next_btn.setToolTip("Next")
-        self.next_btn.clicked.connect(self.send_next_command)
-        self.next_btn.setEnabled(False)
-        self.next_btn.setFixedSize(44, 44)
-        self.next_btn.setStyleSheet(control_btn_style)
+        self.next_btn = self._make_tool_button(
+            "arrow-right", "Next", partial(self._send_command, Command.NEXT)
+        )
         command_layout.addWidget(self.next_btn)
 
         # Stop button with square icon
-        self.stop_btn = QPushButton()
-        self.stop_btn.setIcon(QIcon(str(self.assets_dir / "square.svg")))
-        self.stop_btn.setIconSize(QSize(24, 24))
-        self.stop_btn.setToolTip("Stop")
-        self.stop_btn.clicked.connect(self.send_stop_command)
-        self.stop_btn.setEnabled(False)
-        self.stop_btn.setFixedSize(44, 44)
-        self.stop_btn.setStyleSheet(control_btn_style)
+        self.stop_btn = self._make_tool_button(
+            "square", "Stop", partial(self._send_command, Command.STOP)
+        )
         command_layout.addWidget(self.stop_btn)
 
         # Restart button with rotate-ccw icon
-        self.restart_btn = QPushButton()
-        self.restart_btn.setIcon(QIcon(str(self.assets_dir / "rotate-ccw.svg")))
-        self.restart_btn.setIconSize(QSize(24, 24))
-        self.restart_btn.setToolTip("Restart")
-        self.restart_btn.clicked.connect(self.send_restart_command)
-        self.restart_btn.setEnabled(False)
-        self.restart_btn.setFixedSize(44, 44)
-        self.restart_btn.setStyleSheet(control_btn_style)
+        self.restart_btn = self._make_tool_button(
+            "rotate-ccw", "Restart", partial(self._send_command, Command.RESTART)
+        )
         command_layout.addWidget(self.restart_btn)
 
         command_layout.addStretch()
@@ -287,11 +427,19 @@ class ReyerMainWindow(QMainWindow):
         log_label.setTextFormat(Qt.RichText)
         main_layout.addWidget(log_label)
 
-        self.log_output = QTextEdit()
+        # Plain text: log lines are never parsed as rich text
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
         self.log_output.setMaximumHeight(150)
+        self.log_output.setMaximumBlockCount(2000)
         main_layout.addWidget(self.log_output)
 
+        # Coalesce bursts of log messages into a single append
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
     def _create_sidebar(self, parent_layout):
         """Create the sidebar with protocol history and management buttons."""
         sidebar_widget = QWidget()
@@ -337,13 +485,23 @@ class ReyerMainWindow(QMainWindow):
         config = ClientConfig()
         self.client = ReyerClient(config)
 
-        # Register callbacks with lambdas that emit signals
-        self.client.register_on_connected(lambda: self.connection_signals.connected.emit())
-        self.client.register_on_disconnected(lambda: self.connection_signals.disconnected.emit())
+        # Register signal emitters directly as client callbacks
+        self.client.register_on_connected(self.connection_signals.connected.emit)
+        self.client.register_on_disconnected(self.connection_signals.disconnected.emit)
 
         # Connect signals to UI update methods
         self.connection_signals.connected.connect(self.on_pipe_connected)
         self.connection_signals.disconnected.connect(self.on_pipe_disconnected)
+        self.connection_signals.protocol_events_ready.connect(self._drain_protocol_events)
+        self.file_io_signals.loaded.connect(self._on_protocol_loaded)
+        self.file_io_signals.load_failed.connect(self._on_protocol_load_failed)
+        self.file_io_signals.saved.connect(self._on_protocol_saved)
+        self.file_io_signals.save_failed.connect(self._on_protocol_save_failed)
+
+        # Protocol sends block on the server reply, so they run on a worker
+        self._send_worker = ProtocolSendWorker(self.client, self)
+        self._send_worker.send_result.connect(self._on_protocol_sent)
+        self._send_worker.start()
 
         self.log("ReyerClient initialized")
 
@@ -353,14 +511,24 @@ class ReyerMainWindow(QMainWindow):
         self.client.connect()
 
 
+    def _set_connection_status(self, connected: bool):
+        """Show the connection state, skipping the restyle if it is unchanged."""
+        if connected == self._status_connected:
+            return
+        self._status_connected = connected
+        if connected:
+            self.status_icon.setPixmap(self._status_pixmap("circle-check"))
+            self.status_label.setText("Connected")
+            self.status_label.setStyleSheet("color: green; font-weight: bold; padding: 10px;")
+        else:
+            self.status_icon.setPixmap(self._status_pixmap("circle-x"))
+            self.status_label.setText("Disconnected")
+            self.status_label.setStyleSheet("font-weight: bold; padding: 10px; color: red;")
+
     def on_pipe_connected(self):
         """Handle pipe connected event from NNG."""
         # Update UI status
-        icon = QIcon(str(self.assets_dir / "circle-check.svg"))
-        pixmap = icon.pixmap(QSize(24, 24))
-        self.status_icon.setPixmap(pixmap)
-        self.status_label.setText("Connected")
-        self.status_label.setStyleSheet("color: green; font-weight: bold; padding: 10px;")
+        self._set_connection_status(True)
 
         # Query runtime state
         self.runtime_state = self.client.get_runtime_state()
@@ -373,45 +541,50 @@ class ReyerMainWindow(QMainWindow):
             self.log("Runtime ready (graphics already initialized)")
             self._enable_protocol_controls()
 
-        # Subscribe to protocol events
-        self.client.subscribe_to_topic(BroadcastTopic.PROTOCOL, self.handle_protocol_event)
+        # Subscribe to protocol events (delivered on the subscription thread,
+        # so they are queued and drained on the GUI thread)
+        self.client.subscribe_to_topic(BroadcastTopic.PROTOCOL, self._queue_protocol_event)
         self.log("Pipe connected to Reyer RT server")
 
     def on_pipe_disconnected(self):
         """Handle pipe disconnected event from NNG."""
         # Set disconnected icon and text
-        icon = QIcon(str(self.assets_dir / "circle-x.svg"))
-        pixmap = icon.pixmap(QSize(24, 24))
-        self.status_icon.setPixmap(pixmap)
-
-        self.status_label.setText("Disconnected")
-        self.status_label.setStyleSheet("font-weight: bold; padding: 10px; color: red;")
-        self.exit_btn.setEnabled(False)
-        self.start_btn.setEnabled(False)
-        self.stop_btn.setEnabled(False)
-        self.next_btn.setEnabled(False)
-        self.previous_btn.setEnabled(False)
-        self.restart_btn.setEnabled(False)
-        self.new_protocol_btn.setEnabled(False)
-        self.load_protocol_btn.setEnabled(False)
-        self.resend_protocol_btn.setEnabled(False)
+        self._set_connection_status(False)
+        self._set_states({
+            self.exit_btn: False,
+            self.start_btn: False,
+            self.stop_btn: False,
+            self.next_btn: False,
+            self.previous_btn: False,
+            self.restart_btn: False,
+            self.new_protocol_btn: False,
+            self.load_protocol_btn: False,
+            self.resend_protocol_btn: False,
+        })
+        self._launcher_bundle = None
+        self._drop_builder_dialog()
         self.log("Pipe disconnected from Reyer RT server")
 
     def _initialize_graphics(self):
         """Show launcher dialog (graphics + pipeline) and initialize runtime."""
-        from src.launcher_dialog import LauncherDialog
+        # Monitors and plugins only change with the server, so fetch them once
+        # per connection in a single round trip
+        if self._launcher_bundle is None:
+            self._launcher_bundle = self.client.get_launcher_bundle()
+        bundle = self._launcher_bundle or {}
 
-        monitors = self.client.get_monitors()
+        monitors = bundle.get("monitors")
         if not monitors:
+            self._launcher_bundle = None
             QMessageBox.critical(self, "Error",
                 "Failed to fetch monitor information.\n"
                 "Please check the connection and try again.")
             return
 
-        sources = self.client.get_sources() or []
-        stages = self.client.get_stages() or []
-        calibrations = self.client.get_calibrations() or []
-        filters = self.client.get_filters() or []
+        sources = bundle.get("sources") or []
+        stages = bundle.get("stages") or []
+        calibrations = bundle.get("calibrations") or []
+        filters = bundle.get("filters") or []
 
         dialog = LauncherDialog(
             self.client, monitors, sources, stages,
@@ -429,12 +602,13 @@ class ReyerMainWindow(QMainWindow):
 
     def _enable_protocol_controls(self):
         """Enable protocol-related controls after graphics initialization."""
-        self.new_protocol_btn.setEnabled(True)
-        self.load_protocol_btn.setEnabled(True)
-        self.exit_btn.setEnabled(True)
-
         has_selection = bool(self.protocol_list_widget.selectedItems())
-        self.resend_protocol_btn.setEnabled(has_selection)
+        self._set_states({
+            self.new_protocol_btn: True,
+            self.load_protocol_btn: True,
+            self.exit_btn: True,
+            self.resend_protocol_btn: has_selection,
+        })
 
     def open_protocol_builder(self):
         """Open protocol builder dialog."""
@@ -447,27 +621,57 @@ class ReyerMainWindow(QMainWindow):
                 "Graphics settings must be initialized before creating protocols.")
             return
 
-        # Open protocol builder dialog (it will fetch its own data)
+        # Open protocol builder dialog (it fetches its own data once and is
+        # reused until the connection drops)
         self.log("Opening protocol builder...")
-        dialog = ProtocolBuilderDialog(self.client, self)
+        if self._builder_dialog is None:
+            self._builder_dialog = ProtocolBuilderDialog(self.client, self)
+        else:
+            self._builder_dialog.reset()
+        dialog = self._builder_dialog
         protocol = dialog.build_protocol()
+        if not dialog.has_resources:
+            # Fetch again on the next open
+            self._drop_builder_dialog()
 
         if protocol:
-            # Send protocol to server
-            self.log(f"Sending protocol '{protocol.name}' to server...")
-            success = self.client.send_protocol(protocol)
-            logger.info(f"send_protocol returned: {success}")
-
-            if success:
-                self.log(f"Protocol '{protocol.name}' sent successfully")
-                # Add to history
-                self._add_to_history(protocol)
-            else:
-                self.log(f"Warning: Protocol send returned False - check server logs")
-                # Don't show error popup as protocol may have been received by server
+            self._send_protocol(protocol)
         else:
             self.log("Protocol creation cancelled")
 
+    def _drop_builder_dialog(self):
+        """Discard the cached protocol builder dialog."""
+        if self._builder_dialog is not None:
+            self._builder_dialog.deleteLater()
+            self._builder_dialog = None
+
+    def _run_protocol_file_dialog(self, title: str, accept_mode: QFileDialog.AcceptMode,
+                                  name_filters: list[str], suggested_name: str = "") -> tuple[str, str]:
+        """
+        Show the shared protocol file dialog, starting in the last used directory.
+
+        Returns:
+            Tuple of (file path, selected name filter), or ("", "") if cancelled
+        """
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+        dialog = self._file_dialog
+        dialog.setWindowTitle(title)
+        dialog.setAcceptMode(accept_mode)
+        dialog.setFileMode(
+            QFileDialog.ExistingFile if accept_mode == QFileDialog.AcceptOpen else QFileDialog.AnyFile
+        )
+        dialog.setNameFilters(name_filters)
+        dialog.setDirectory(self._last_protocol_dir)
+        dialog.selectFile(suggested_name)
+
+        if not dialog.exec():
+            return "", ""
+
+        file_path = dialog.selectedFiles()[0]
+        self._last_protocol_dir = str(Path(file_path).parent)
+        return file_path, dialog.selectedNameFilter()
+
     def load_and_send_protocol(self):
         """Load a protocol from file and send it to the server."""
         if not self.client.is_connected():
@@ -475,120 +679,96 @@ class ReyerMainWindow(QMainWindow):
             return
 
         # Open file dialog
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
+        file_path, _ = self._run_protocol_file_dialog(
             "Load Protocol",
-            "",
-            "JSON Files (*.json);;All Files (*)"
+            QFileDialog.AcceptOpen,
+            ["Protocol Files (*.msgpack *.json)", "MsgPack Files (*.msgpack)",
+             "JSON Files (*.json)", "All Files (*)"]
         )
 
         if not file_path:
             return  # User cancelled
 
-        try:
-            # Read and deserialize protocol
-            with open(file_path, 'rb') as f:
-                json_data = f.read()
-
-            protocol = msgspec.json.decode(json_data, type=ProtocolRequest)
-
-            # Send protocol to server
-            self.log(f"Sending protocol '{protocol.name}' to server...")
-            success = self.client.send_protocol(protocol)
-            logger.info(f"send_protocol returned: {success}")
-
-            if success:
-                self.log(f"Protocol '{protocol.name}' sent successfully")
-                # Add to history
-                self._add_to_history(protocol)
-            else:
-                self.log(f"Warning: Protocol send returned False - check server logs")
-
-        except Exception as e:
-            self.log(f"Error loading protocol: {e}")
-            QMessageBox.critical(
-                self,
-                "Load Error",
-                f"Failed to load protocol:\n{str(e)}"
-            )
-
-    def send_start_command(self):
-        """Send START command to graphics manager."""
-        if not self.client.is_connected():
-            self.log("Cannot send command: not connected")
-            return
-
-        success = self.client.send_command(Command.START)
-        if success:
-            self.log("START command sent successfully")
-        else:
-            self.log("Failed to send START command")
-
-    def send_stop_command(self):
-        """Send STOP command to graphics manager."""
-        if not self.client.is_connected():
-            self.log("Cannot send command: not connected")
-            return
+        # Read and deserialize on the thread pool; sent from _on_protocol_loaded
+        QThreadPool.globalInstance().start(
+            _LoadProtocolRunnable(file_path, self.file_io_signals)
+        )
 
-        success = self.client.send_command(Command.STOP)
-        if success:
-            self.log("STOP command sent successfully")
-        else:
-            self.log("Failed to send STOP command")
+    def _on_protocol_loaded(self, protocol: ProtocolRequest):
+        """Send a protocol read from file."""
+        self._send_protocol(protocol)
 
-    def send_next_command(self):
-        """Send NEXT command to graphics manager."""
-        if not self.client.is_connected():
-            self.log("Cannot send command: not connected")
-            return
+    def _on_protocol_load_failed(self, error: str):
+        """Report a protocol file that could not be read or decoded."""
+        self.log(f"Error loading protocol: {error}")
+        QMessageBox.critical(
+            self,
+            "Load Error",
+            f"Failed to load protocol:\n{error}"
+        )
 
-        success = self.client.send_command(Command.NEXT)
-        if success:
-            self.log("NEXT command sent successfully")
-        else:
-            self.log("Failed to send NEXT command")
+    def _send_protocol(self, protocol: ProtocolRequest, encoded: bytes | None = None,
+                       resend: bool = False):
+        """Queue a protocol for the send worker; the result arrives in _on_protocol_sent."""
+        action = "Resending" if resend else "Sending"
+        self.log(f"{action} protocol '{protocol.name}' to server...")
+        self._sends_in_flight.append(protocol)
+        self._send_worker.enqueue(protocol, encoded, resend)
 
-    def send_previous_command(self):
-        """Send PREVIOUS command to graphics manager."""
-        if not self.client.is_connected():
-            self.log("Cannot send command: not connected")
-            return
+    def _on_protocol_sent(self, protocol: ProtocolRequest, encoded: bytes, success: bool,
+                          resend: bool):
+        """Handle the result of a queued protocol send."""
+        self._sends_in_flight.remove(protocol)
+        logger.info("send_protocol returned: %s", success)
 
-        success = self.client.send_command(Command.PREVIOUS)
         if success:
-            self.log("PREVIOUS command sent successfully")
+            self.log(f"Protocol '{protocol.name}' {'resent' if resend else 'sent'} successfully")
+            # Add to history
+            self._add_to_history(protocol, encoded)
         else:
-            self.log("Failed to send PREVIOUS command")
-
-    def send_restart_command(self):
-        """Send RESTART command to graphics manager."""
-        if not self.client.is_connected():
-            self.log("Cannot send command: not connected")
-            return
-
-        success = self.client.send_command(Command.RESTART)
-        if success:
-            self.log("RESTART command sent successfully")
-        else:
-            self.log("Failed to send RESTART command")
+            self.log(f"Warning: Protocol send returned False - check server logs")
+            # Don't show error popup as protocol may have been received by server
 
-    def send_exit_command(self):
-        """Send EXIT command to graphics manager."""
+    def _send_command(self, command: Command, _checked: bool = False):
+        """Send a control command to graphics manager."""
         if not self.client.is_connected():
             self.log("Cannot send command: not connected")
             return
 
-        success = self.client.send_command(Command.EXIT)
+        success = self.client.send_command(command)
         if success:
-            self.log("EXIT command sent successfully")
+            self.log(f"{command.name} command sent successfully")
         else:
-            self.log("Failed to send EXIT command")
+            self.log(f"Failed to send {command.name} command")
 
     def log(self, message: str):
-        """Add a message to the log output."""
-        self.log_output.append(message)
+        """Queue a message for the log output."""
+        self._log_buffer.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
         logger.info(message)
 
+    def _flush_log(self):
+        """Append all buffered log messages in one update."""
+        self.log_output.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+
+    def _queue_protocol_event(self, event_msg: ProtocolEventMessage):
+        """Queue an event from the subscription thread for the GUI thread."""
+        self._pending_events.append(event_msg)
+        # One queued signal per burst rather than per event
+        if not self._event_drain_posted:
+            self._event_drain_posted = True
+            self.connection_signals.protocol_events_ready.emit()
+
+    def _drain_protocol_events(self):
+        """Handle all protocol events queued since the last drain."""
+        # Clear the flag first so an event appended mid-drain posts a new drain
+        self._event_drain_posted = False
+        pending = self._pending_events
+        while pending:
+            self.handle_protocol_event(pending.popleft())
+
     def handle_protocol_event(self, event_msg: ProtocolEventMessage):
         """
         Handle protocol event messages from the server.
@@ -596,52 +776,78 @@ class ReyerMainWindow(QMainWindow):
         Args:
             event_msg: ProtocolEventMessage containing event type and data
         """
-        if event_msg.event == ProtocolEvent.GRAPHICS_READY:
-            self.graphics_initialized = True
-            self.runtime_state = RuntimeState.STANDBY
-            self.log("Graphics initialized and ready")
-            self._enable_protocol_controls()
-
-        elif event_msg.event == ProtocolEvent.PROTOCOL_NEW:
-            self.current_protocol_uuid = event_msg.protocol_uuid
-            # Match UUID to protocol in history to get name and full protocol
-            for entry in self.protocol_history:
-                if hasattr(entry['protocol'], 'protocol_uuid') and \
-                   entry['protocol'].protocol_uuid == event_msg.protocol_uuid:
-                    self.current_protocol = entry['protocol']
-                    self.current_protocol_name = entry['protocol'].name
-                    self.total_tasks = len(entry['protocol'].tasks)
-                    break
-            self.current_protocol_label.setText(f"{self.current_protocol_name} (Loaded)")
-            self.log(f"Protocol '{self.current_protocol_name}' loaded")
-            self.update_control_buttons(event_msg.event, 0, self.total_tasks)
-
-        elif event_msg.event == ProtocolEvent.TASK_START:
-            self.current_task_index = event_msg.data
-
-            # Get task name from protocol
+        handler = self._event_handlers.get(event_msg.event)
+        if handler is not None:
+            handler(event_msg)
+
+    def _on_graphics_ready(self, event_msg: ProtocolEventMessage):
+        """Handle GRAPHICS_READY: runtime is initialized and in standby."""
+        self.graphics_initialized = True
+        self.runtime_state = RuntimeState.STANDBY
+        self.log("Graphics initialized and ready")
+        self._enable_protocol_controls()
+
+    def _on_protocol_new(self, event_msg: ProtocolEventMessage):
+        """Handle PROTOCOL_NEW: a protocol was loaded by the server."""
+        state = self.protocol_state
+        state.uuid = event_msg.protocol_uuid
+        # Match UUID to protocol in history to get name and full protocol.
+        # The event can arrive before the send result, so check sends in
+        # flight too.
+        protocol = None
+        for pending in self._sends_in_flight:
+            if pending.protocol_uuid == event_msg.protocol_uuid:
+                protocol = pending
+                break
+        else:
+            entry = self._history_by_uuid.get(event_msg.protocol_uuid)
+            if entry is not None:
+                protocol = entry.protocol
+        if protocol is not None:
+            state.protocol = protocol
+            state.name = protocol.name
+            state.total_tasks = len(protocol.tasks)
+        self.current_protocol_label.setText(f"{state.name} (Loaded)")
+        self.log(f"Protocol '{state.name}' loaded")
+        self.update_control_buttons(event_msg.event, 0, state.total_tasks)
+
+    def _on_task_start(self, event_msg: ProtocolEventMessage):
+        """Handle TASK_START: data carries the index of the started task."""
+        state = self.protocol_state
+        state.task_index = event_msg.data
+
+        # Get task name from protocol
+        task_name = "Unknown"
+        if state.protocol and state.task_index < len(state.protocol.tasks):
+            task_name = state.protocol.tasks[state.task_index].name
+
+        self.current_protocol_label.setText(
+            f"{state.name} - Task {state.task_index + 1}/{state.total_tasks}: {task_name}"
+        )
+        self.log(f"Task {state.task_index + 1}/{state.total_tasks} started: {task_name}")
+        self.update_control_buttons(event_msg.event, state.task_index, state.total_tasks)
+
+    def _on_task_end(self, event_msg: ProtocolEventMessage):
+        """Handle TASK_END: the current task finished."""
+        state = self.protocol_state
+        # Check if this was the last task
+        if state.task_index >= state.total_tasks - 1:
+            self.current_protocol_label.setText(f"{state.name} (Completed)")
+            self.log(f"Protocol '{state.name}' completed")
+        else:
+            # Get task name for log
             task_name = "Unknown"
-            if self.current_protocol and self.current_task_index < len(self.current_protocol.tasks):
-                task_name = self.current_protocol.tasks[self.current_task_index].name
-
-            self.current_protocol_label.setText(
-                f"{self.current_protocol_name} - Task {self.current_task_index + 1}/{self.total_tasks}: {task_name}"
-            )
-            self.log(f"Task {self.current_task_index + 1}/{self.total_tasks} started: {task_name}")
-            self.update_control_buttons(event_msg.event, self.current_task_index, self.total_tasks)
-
-        elif event_msg.event == ProtocolEvent.TASK_END:
-            # Check if this was the last task
-            if self.current_task_index >= self.total_tasks - 1:
-                self.current_protocol_label.setText(f"{self.current_protocol_name} (Completed)")
-                self.log(f"Protocol '{self.current_protocol_name}' completed")
-            else:
-                # Get task name for log
-                task_name = "Unknown"
-                if self.current_protocol and self.current_task_index < len(self.current_protocol.tasks):
-                    task_name = self.current_protocol.tasks[self.current_task_index].name
-                self.log(f"Task {self.current_task_index + 1} ended: {task_name}")
-            self.update_control_buttons(event_msg.event, self.current_task_index, self.total_tasks)
+            if state.protocol and state.task_index < len(state.protocol.tasks):
+                task_name = state.protocol.tasks[state.task_index].name
+            self.log(f"Task {state.task_index + 1} ended: {task_name}")
+        self.update_control_buttons(event_msg.event, state.task_index, state.total_tasks)
+
+    @staticmethod
+    def _set_states(states: dict[QPushButton, bool]):
+        """Enable/disable buttons, skipping those already in the wanted state."""
+        for button, enabled in states.items():
+            if button.isEnabled() != enabled:
+                button.setEnabled(enabled)
 
     def update_control_buttons(self, event: int, task_index: int, total_tasks: int):
         """
@@ -652,138 +858,151 @@ class ReyerMainWindow(QMainWindow):
             task_index: Current task index (0-based)
             total_tasks: Total number of tasks in protocol
         """
-        if event == ProtocolEvent.PROTOCOL_NEW:
-            # Protocol loaded but not started - only START enabled
-            self.start_btn.setEnabled(True)
-            self.stop_btn.setEnabled(False)
-            self.next_btn.setEnabled(False)
-            self.previous_btn.setEnabled(False)
-            self.restart_btn.setEnabled(False)
-
-        elif event == ProtocolEvent.TASK_START:
-            # Task is running - enable based on position
-            self.start_btn.setEnabled(False)  # Can't start when already running
-            self.stop_btn.setEnabled(True)
-            self.restart_btn.setEnabled(True)
-
-            # PREVIOUS only if not on first task
-            self.previous_btn.setEnabled(task_index > 0)
-
-            # NEXT only if not on last task
+        if event == ProtocolEvent.TASK_START:
+            # Task is running - PREVIOUS only if not on first task, NEXT
+            # only if not on last task
             is_last_task = (task_index >= total_tasks - 1)
-            self.next_btn.setEnabled(not is_last_task)
-
-        elif event == ProtocolEvent.TASK_END:
-            # Task ended (mid-protocol stop or natural completion)
-            # Protocol is still loaded — enable START for re-run
-            self.start_btn.setEnabled(True)
-            self.stop_btn.setEnabled(False)
-            self.next_btn.setEnabled(False)
-            self.previous_btn.setEnabled(False)
-            self.restart_btn.setEnabled(False)
+            self._set_states({
+                self.start_btn: False,  # Can't start when already running
+                self.stop_btn: True,
+                self.restart_btn: True,
+                self.previous_btn: task_index > 0,
+                self.next_btn: not is_last_task,
+            })
+
+        elif event in (ProtocolEvent.PROTOCOL_NEW, ProtocolEvent.TASK_END):
+            # Protocol loaded but not started, or task ended (mid-protocol
+            # stop or natural completion) - only START enabled
+            self._set_states({
+                self.start_btn: True,
+                self.stop_btn: False,
+                self.next_btn: False,
+                self.previous_btn: False,
+                self.restart_btn: False,
+            })
 
     def closeEvent(self, event):
         """Handle window close event."""
-        if self.client and self.client.is_connected():
+        finished = self._send_worker.stop()
+        # Disconnecting closes the request socket, which also ends a send
+        # still waiting on an unresponsive server
+        if self.client and (self.client.is_connected() or not finished):
             self.client.disconnect()
+        if not finished:
+            self._send_worker.wait()
         event.accept()
 
     # Protocol Management Methods
 
-    def _add_to_history(self, protocol: ProtocolRequest):
+    def _add_to_history(self, protocol: ProtocolRequest, encoded: bytes):
         """Add a protocol to the history list."""
-        history_entry = {
-            'protocol': protocol,
-            'timestamp': datetime.now(),
-            'name': protocol.name,
-            'participant_id': protocol.participant_id
-        }
-        self.protocol_history.insert(0, history_entry)  # Add to beginning (most recent first)
-        self._refresh_protocol_history()
-
-    def _refresh_protocol_history(self):
-        """Refresh the protocol history display."""
-        self.protocol_list_widget.clear()
-
-        for entry in self.protocol_history:
-            # Display format: "name (participant_id) - timestamp"
-            timestamp_str = entry['timestamp'].strftime("%H:%M:%S")
-            display_text = f"{entry['name']} ({entry['participant_id']}) - {timestamp_str}"
-            item = QListWidgetItem(display_text)
-            # Store protocol object in item data for later retrieval
-            item.setData(Qt.UserRole, entry['protocol'])
-            self.protocol_list_widget.addItem(item)
+        # Formatted once; the display text never changes
+        time_str = datetime.now().strftime("%H:%M:%S")
+        history_entry = HistoryEntry(
+            protocol=protocol,
+            encoded=encoded,
+            display_text=f"{protocol.name} ({protocol.participant_id}) - {time_str}",
+        )
+        # The deque drops its oldest entry when full; drop its index too
+        # unless a newer send of the same protocol replaced it
+        if len(self.protocol_history) == self.protocol_history.maxlen:
+            oldest = self.protocol_history[-1]
+            if self._history_by_uuid.get(oldest.protocol.protocol_uuid) is oldest:
+                del self._history_by_uuid[oldest.protocol.protocol_uuid]
+        self.protocol_history.appendleft(history_entry)
+        if protocol.protocol_uuid:
+            self._history_by_uuid[protocol.protocol_uuid] = history_entry
+        self._prepend_history_item(history_entry)
+
+    def _prepend_history_item(self, entry: HistoryEntry):
+        """Insert a single history entry at the top of the history list."""
+        item = QListWidgetItem(entry.display_text)
+        # Store the entry itself so a selection resolves without a lookup
+        item.setData(Qt.UserRole, entry)
+
+        # Insert and trim as one repaint
+        self.protocol_list_widget.setUpdatesEnabled(False)
+        self.protocol_list_widget.blockSignals(True)
+        self.protocol_list_widget.insertItem(0, item)
+        # Keep the list in step with the bounded history
+        while self.protocol_list_widget.count() > self.HISTORY_LIMIT:
+            self.protocol_list_widget.takeItem(self.protocol_list_widget.count() - 1)
+        self.protocol_list_widget.blockSignals(False)
+        self.protocol_list_widget.setUpdatesEnabled(True)
+        # Signals were blocked, so re-sync the buttons once (trimming may
+        # have dropped the selected item)
+        self._on_protocol_selection_changed()
+
+    def _get_selected_history_entry(self) -> HistoryEntry | None:
+        """Return the history entry for the selected list item, if any."""
+        item = self.protocol_list_widget.currentItem()
+        if item is None or not item.isSelected():
+            return None
+        return item.data(Qt.UserRole)
 
     def _on_protocol_selection_changed(self):
         """Handle protocol selection change in list."""
         has_selection = bool(self.protocol_list_widget.selectedItems())
 
-        # Enable save button if protocol selected
-        self.save_protocol_btn.setEnabled(has_selection)
-
-        # Only enable resend button if connected and protocol selected
-        self.resend_protocol_btn.setEnabled(
-            has_selection and self.client.is_connected()
-        )
+        self._set_states({
+            # Save needs a selection; resend also needs a connection
+            self.save_protocol_btn: has_selection,
+            self.resend_protocol_btn: has_selection and self.client.is_connected(),
+        })
 
     def save_selected_protocol(self):
         """Save the selected protocol to user-specified location via file dialog."""
-        selected_items = self.protocol_list_widget.selectedItems()
-        if not selected_items:
+        entry = self._get_selected_history_entry()
+        if entry is None:
             self.log("No protocol selected")
             return
-
-        # Get protocol from selected item
-        item = selected_items[0]
-        protocol = item.data(Qt.UserRole)
-
-        if not protocol:
-            self.log("Failed to retrieve protocol from selection")
-            return
+        protocol = entry.protocol
 
         # Suggest a filename based on protocol name
-        suggested_name = "".join(c if c.isalnum() or c in ('-', '_') else '_'
-                                for c in protocol.name)
-        suggested_name = f"{suggested_name}.json"
+        suggested_name = f"{safe_filename(protocol.name)}.msgpack"
 
         # Open save file dialog
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
+        file_path, selected_filter = self._run_protocol_file_dialog(
             "Save Protocol",
-            suggested_name,
-            "JSON Files (*.json);;All Files (*)"
+            QFileDialog.AcceptSave,
+            ["MsgPack Files (*.msgpack)", "JSON Files (*.json)", "All Files (*)"],
+            suggested_name
         )
 
         if not file_path:
             return  # User cancelled
 
-        filepath = Path(file_path)
-
-        # Ensure .json extension
-        if filepath.suffix.lower() != '.json':
-            filepath = filepath.with_suffix('.json')
-
-        try:
-            # Serialize and save protocol
-            json_data = msgspec.json.encode(protocol)
+        # Ensure a protocol extension, following the chosen filter
+        lower = file_path.lower()
+        if lower.endswith('.msgpack') or lower.endswith('.json'):
+            filepath = file_path
+        elif selected_filter.startswith('JSON'):
+            filepath = file_path + '.json'
+        else:
+            filepath = file_path + '.msgpack'
 
-            with open(filepath, 'wb') as f:
-                f.write(json_data)
+        # Serialize and write on the thread pool
+        QThreadPool.globalInstance().start(
+            _SaveProtocolRunnable(protocol, filepath, self.file_io_signals)
+        )
 
-            self.log(f"Protocol saved to {filepath}")
-            QMessageBox.information(
-                self,
-                "Save Successful",
-                f"Protocol saved to:\n{filepath}"
-            )
+    def _on_protocol_saved(self, filepath: str):
+        """Report a protocol file that was written."""
+        self.log(f"Protocol saved to {filepath}")
+        QMessageBox.information(
+            self,
+            "Save Successful",
+            f"Protocol saved to:\n{filepath}"
+        )
 
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Save Error",
-                f"Failed to save protocol:\n{str(e)}"
-            )
-            self.log(f"Error saving protocol: {e}")
+    def _on_protocol_save_failed(self, error: str):
+        """Report a protocol file that could not be written."""
+        QMessageBox.critical(
+            self,
+            "Save Error",
+            f"Failed to save protocol {error}"
+        )
+        self.log(f"Error saving protocol {error}")
 
     def resend_protocol_from_history(self):
         """Resend the selected protocol from history."""
@@ -791,30 +1010,11 @@ class ReyerMainWindow(QMainWindow):
             self.log("Cannot send protocol: not connected")
             return
 
-        selected_items = self.protocol_list_widget.selectedItems()
-        if not selected_items:
+        entry = self._get_selected_history_entry()
+        if entry is None:
             self.log("No protocol selected")
             return
-
-        # Get protocol from selected item
-        item = selected_items[0]
-        protocol = item.data(Qt.UserRole)
-
-        if not protocol:
-            self.log("Failed to retrieve protocol from history")
-            return
-
-        # Send protocol to server
-        self.log(f"Resending protocol '{protocol.name}' to server...")
-        success = self.client.send_protocol(protocol)
-        logger.info(f"send_protocol returned: {success}")
-
-        if success:
-            self.log(f"Protocol '{protocol.name}' resent successfully")
-            # Add to history again
-            self._add_to_history(protocol)
-        else:
-            self.log(f"Warning: Protocol send returned False - check server logs")
+        self._send_protocol(entry.protocol, entry.encoded, resend=True)
 
 
 def main():
@@ -1,21 +1,50 @@
 """PyNNG client for communicating with reyer_rt via IPC sockets."""
 
 from __future__ import annotations
-import msgspec
 
+import asyncio
+import msgspec
 import pynng
+from concurrent.futures import Future
 from typing import Optional, Callable, List
 from dataclasses import dataclass
 import threading
 import logging
 
-from .messages import Message, Ping, Pong, Response, serialize_message, deserialize_message
+from .messages import (
+    Message, Ping, Pong, Response, ResourceCode, ResourceRequest, ResourceBatchRequest,
+    PluginInfo, MonitorInfo, RuntimeState, PipelineConfigRequest, CommandRequest,
+    BroadcastMessage, BroadcastTopic, ProtocolEventMessage,
+    serialize_message, deserialize_message, get_decoder,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class _TopicPeek(msgspec.Struct):
+    """Just the topic of a BroadcastMessage; the payload is skipped, not copied."""
+    topic: int
+
+
+# Reused for every published message on the subscription thread
+_TOPIC_DECODER = get_decoder(_TopicPeek)
+_BROADCAST_DECODER = get_decoder(BroadcastMessage)
+_PROTOCOL_EVENT_DECODER = get_decoder(ProtocolEventMessage)
+
+# Payload decoders for resource responses
+_PLUGIN_LIST_DECODER = get_decoder(List[PluginInfo])
+_MONITOR_LIST_DECODER = get_decoder(List[MonitorInfo])
+_RESPONSE_LIST_DECODER = get_decoder(List[Response])
+
+# Ping(timestamp=0) is fixed, so encode it once for the connect test
+_ZERO_PING = serialize_message(Ping(timestamp=0))
+
+# Most published messages dispatched per receive wakeup
+_BROADCAST_BATCH_MAX = 32
+
+
+@dataclass(slots=True, frozen=True)
 class ClientConfig:
     """Configuration for the reyer_rt client."""
     req_socket_addr: str = "ipc:///tmp/reyer-rep.sock"  # ReplySocket address in reyer_rt
@@ -48,8 +77,14 @@ class ReyerClient:
         self._pub_socket: Optional[pynng.Pub0] = None
         self._sub_socket: Optional[pynng.Sub0] = None
         self._connected = False
-        self._lock = threading.RLock()
+        # Separate locks so connection setup and subscription changes don't
+        # wait on each other; _connected is a plain bool read without a lock
+        self._req_lock = threading.Lock()  # Request socket open/close and its contexts
+        self._req_contexts: set[pynng.Context] = set()  # Contexts of in-flight requests
+        self._sub_lock = threading.Lock()  # Subscription socket, callbacks and thread
         self._subscription_thread: Optional[threading.Thread] = None
+        self._sub_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sub_task: Optional[asyncio.Task] = None
         self._subscription_callbacks: dict[str, list[Callable]] = {}
         self._running = False
 
@@ -57,81 +92,157 @@ class ReyerClient:
         self._on_connected_callback: Optional[Callable] = None
         self._on_disconnected_callback: Optional[Callable] = None
 
+        # Last payload and decoded list per resource code
+        self._resource_cache: dict[int, tuple[str, list]] = {}
 
-    def connect(self) -> None:
+    def connect(self) -> Future:
         """
         Connect to reyer_rt server asynchronously in a background thread.
         Connection status updates are emitted via callbacks.
+
+        Returns:
+            Future resolving to True once the server answered the connection
+            ping, or False if the socket could not be dialed or tested
         """
+        future: Future = Future()
         # Run connection in background thread to avoid blocking the UI
-        thread = threading.Thread(target=self._connect_async, daemon=True)
+        thread = threading.Thread(target=self._connect_async, args=(future,), daemon=True)
         thread.start()
+        return future
 
-    def _connect_async(self) -> None:
+    def _connect_async(self, future: Future) -> None:
         """Async connection worker thread."""
-        with self._lock:
+        # Only socket setup is locked; the test ping below runs on its own
+        # context so it doesn't hold up requests racing the connection
+        with self._req_lock:
             try:
                 # Initialize request/reply socket
-                self._request_socket = pynng.Req0()
+                socket = pynng.Req0()
+                self._request_socket = socket
 
                 # Register pipe event callbacks
-                self._request_socket.add_post_pipe_connect_cb(lambda pipe: self._handle_pipe_connect())
-                self._request_socket.add_post_pipe_remove_cb(lambda pipe: self._handle_pipe_remove())
-
-                self._request_socket.recv_timeout = self.config.receive_timeout_ms
-                self._request_socket.dial(self.config.req_socket_addr)
+                socket.add_post_pipe_connect_cb(lambda pipe: self._handle_pipe_connect())
+                socket.add_post_pipe_remove_cb(lambda pipe: self._handle_pipe_remove())
 
-                # Test the connection by sending a ping
-                # This ensures the connection actually works, not just that the socket was created
-                test_ping = Ping(timestamp=0)
-                test_data = serialize_message(test_ping)
+                socket.recv_timeout = self.config.receive_timeout_ms
+                socket.dial(self.config.req_socket_addr)
 
+            except Exception as e:
+                logger.error("Failed to create/dial socket: %s", e)
                 try:
-                    self._request_socket.send(test_data)
-                    _ = self._request_socket.recv()
-                    logger.info(f"Connected to reyer_rt server at {self.config.req_socket_addr}")
-                except (pynng.Timeout, Exception) as e:
-                    logger.error(f"Connection test failed (socket created but not responsive): {e}")
-                    if self._request_socket:
-                        self._request_socket.close()
-                        self._request_socket = None
-                    self._connected = False
+                    self._close_request_socket_locked()
+                except Exception:
+                    pass
+                self._connected = False
+                future.set_result(False)
+                return
 
-            except Exception as e:
-                logger.error(f"Failed to create/dial socket: {e}")
-                if self._request_socket:
-                    try:
-                        self._request_socket.close()
-                    except:
-                        pass
-                    self._request_socket = None
+        # Test the connection by sending a ping
+        # This ensures the connection actually works, not just that the socket was created
+        ctx = None
+        try:
+            ctx = self._open_context(socket)
+            if ctx is None:
+                logger.info("Connection test skipped: request socket closed during connect")
+                future.set_result(False)
+                return
+            ctx.send(_ZERO_PING)
+            _ = ctx.recv()
+            logger.info("Connected to reyer_rt server at %s", self.config.req_socket_addr)
+            future.set_result(True)
+            return
+        except pynng.Closed:
+            logger.debug("Connection test aborted: request socket closed")
+        except Exception as e:
+            logger.error("Connection test failed (socket created but not responsive): %s", e)
+        finally:
+            if ctx is not None:
+                self._close_context(ctx)
+
+        with self._req_lock:
+            # Leave it alone if disconnect() or a newer connect() replaced it
+            if self._request_socket is socket:
+                self._close_request_socket_locked()
                 self._connected = False
+        future.set_result(False)
 
     def disconnect(self) -> None:
         """Disconnect from reyer_rt server."""
-        with self._lock:
+        with self._sub_lock:
             self._running = False
 
-            # Stop subscription thread if running
+            # Cancel the receive task and wait for its loop thread to finish
             if self._subscription_thread and self._subscription_thread.is_alive():
+                try:
+                    self._sub_loop.call_soon_threadsafe(self._sub_task.cancel)
+                except RuntimeError:
+                    pass  # Loop already closed
                 self._subscription_thread.join(timeout=2.0)
 
+            if self._sub_socket:
+                self._sub_socket.close()
+                self._sub_socket = None
+
+        with self._req_lock:
             # Close sockets
-            if self._request_socket:
-                self._request_socket.close()
-                self._request_socket = None
+            self._close_request_socket_locked()
 
             if self._pub_socket:
                 self._pub_socket.close()
                 self._pub_socket = None
 
-            if self._sub_socket:
-                self._sub_socket.close()
-                self._sub_socket = None
-
             logger.info("Disconnected from reyer_rt server")
             # Pipe remove callback will be triggered by pynng, which will call _handle_pipe_remove()
 
+    def _open_context(self, socket: Optional[pynng.Req0] = None) -> Optional[pynng.Context]:
+        """
+        Open a tracked context on the current request socket.
+
+        Args:
+            socket: If given, only open the context while this is still the
+                    current request socket
+
+        Returns:
+            The new context, or None if the socket was closed or replaced
+        """
+        with self._req_lock:
+            current = self._request_socket
+            if current is None or (socket is not None and current is not socket):
+                return None
+            ctx = current.new_context()
+            self._req_contexts.add(ctx)
+            return ctx
+
+    def _close_context(self, ctx: pynng.Context) -> None:
+        """Close a context from _open_context unless disconnect() already did."""
+        with self._req_lock:
+            if ctx not in self._req_contexts:
+                return
+            self._req_contexts.discard(ctx)
+            try:
+                ctx.close()
+            except pynng.Closed:
+                pass
+
+    def _close_request_socket_locked(self) -> None:
+        """
+        Close the request socket and its open contexts; caller holds _req_lock.
+
+        The contexts go first: closing one aborts its pending recv with
+        pynng.Closed, and a context still open when the socket closes raises
+        from its finalizer instead.
+        """
+        for ctx in self._req_contexts:
+            try:
+                ctx.close()
+            except pynng.Closed:
+                pass
+        self._req_contexts.clear()
+
+        if self._request_socket:
+            self._request_socket.close()
+            self._request_socket = None
+
     def is_connected(self) -> bool:
         """Check if client is connected to server."""
         return self._connected
@@ -175,6 +286,18 @@ class ReyerClient:
         Args:
             message: Message object to send
 
+        Returns:
+            Response bytes from server, or None if request failed
+        """
+        return self.send_encoded_request(serialize_message(message))
+
+    def send_encoded_request(self, data: bytes) -> Optional[bytes]:
+        """
+        Send an already serialized request to reyer_rt and wait for response.
+
+        Args:
+            data: Message serialized with serialize_message
+
         Returns:
             Response bytes from server, or None if request failed
         """
@@ -182,23 +305,38 @@ class ReyerClient:
             logger.error("Cannot send request: not connected to server")
             return None
 
-        with self._lock:
-            try:
-                # Serialize and send message
-                data = serialize_message(message)
-                self._request_socket.send(data)
+        # Each request gets its own REQ context, so concurrent callers are
+        # pipelined on the one socket; the lock is only held to open and
+        # close the context, not across the round trip
+        try:
+            ctx = self._open_context()
+        except Exception as e:
+            logger.error("Error opening request context: %s", e)
+            return None
+        if ctx is None:
+            logger.error("Cannot send request: request socket is closed")
+            return None
 
-                # Wait for response
-                response_data = self._request_socket.recv()
-                logger.debug(f"Received response: {len(response_data)} bytes")
-                return response_data
+        try:
+            ctx.send(data)
 
-            except pynng.Timeout:
-                logger.error("Request timeout while waiting for response")
-                return None
-            except Exception as e:
-                logger.error(f"Error sending request: {e}")
-                return None
+            # Wait for response
+            response_data = ctx.recv()
+            logger.debug("Received response: %d bytes", len(response_data))
+            return response_data
+
+        except pynng.Closed:
+            # disconnect() closed the context or socket under us
+            logger.debug("Request aborted: request socket closed")
+            return None
+        except pynng.Timeout:
+            logger.error("Request timeout while waiting for response")
+            return None
+        except Exception as e:
+            logger.error("Error sending request: %s", e)
+            return None
+        finally:
+            self._close_context(ctx)
 
     def send_ping(self, timestamp: int = 0) -> bool:
         """
@@ -211,70 +349,77 @@ class ReyerClient:
             True if ping was successful and pong received
         """
         try:
-            ping = Ping(timestamp=timestamp)
-            response_data = self.send_request(ping)
+            if timestamp == 0:
+                response_data = self.send_encoded_request(_ZERO_PING)
+            else:
+                response_data = self.send_request(Ping(timestamp=timestamp))
 
             if response_data:
                 pong = deserialize_message(response_data, Pong)
-                logger.info(f"Received pong with timestamp {pong.timestamp}")
+                logger.info("Received pong with timestamp %s", pong.timestamp)
                 return True
             return False
         except Exception as e:
-            logger.error(f"Ping failed: {e}")
+            logger.error("Ping failed: %s", e)
             return False
 
     def _get_plugins_by_type(self, resource_code: int, type_name: str) -> Optional[list]:
         """Internal helper to get plugins by resource type."""
         try:
-            from .messages import ResourceRequest, Response, PluginInfo
-
             request = ResourceRequest(resource_code=resource_code)
             response_data = self.send_request(request)
 
             if response_data:
                 response = deserialize_message(response_data, Response)
                 if response.success and response.payload:
-                    plugins = msgspec.json.decode(response.payload, type=List[PluginInfo])
-                    logger.info(f"Received {len(plugins)} {type_name} from server")
+                    plugins = self._decode_resource_list(resource_code, response.payload)
+                    logger.info("Received %d %s from server", len(plugins), type_name)
                     return plugins
                 else:
-                    logger.error(f"Server returned error: {response.error_message}")
+                    logger.error("Server returned error: %s", response.error_message)
                     return None
             return None
-        except Exception as e:
-            logger.error(f"Failed to get {type_name}: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Failed to get %s", type_name)
             return None
 
+    def _decode_resource_list(self, resource_code: int, payload: str) -> list:
+        """Decode a monitor/plugin list payload, reusing the last result if it is unchanged."""
+        cached = self._resource_cache.get(resource_code)
+        if cached is not None and cached[0] == payload:
+            return list(cached[1])
+
+        decoder = (
+            _MONITOR_LIST_DECODER
+            if resource_code == ResourceCode.AVAILABLE_MONITORS
+            else _PLUGIN_LIST_DECODER
+        )
+        items = decoder.decode(payload)
+        self._resource_cache[resource_code] = (payload, items)
+        return list(items)
+
     def get_sources(self) -> Optional[list]:
         """Get list of available source plugins (IEyeSource)."""
-        from .messages import ResourceCode
         return self._get_plugins_by_type(ResourceCode.AVAILABLE_SOURCES, "sources")
 
     def get_stages(self) -> Optional[list]:
         """Get list of available stage plugins (IEyeStage)."""
-        from .messages import ResourceCode
         return self._get_plugins_by_type(ResourceCode.AVAILABLE_STAGES, "stages")
 
     def get_sinks(self) -> Optional[list]:
         """Get list of available sink plugins (IEyeSink)."""
-        from .messages import ResourceCode
         return self._get_plugins_by_type(ResourceCode.AVAILABLE_SINKS, "sinks")
 
     def get_tasks(self) -> Optional[list]:
         """Get list of available task plugins (IRender)."""
-        from .messages import ResourceCode
         return self._get_plugins_by_type(ResourceCode.AVAILABLE_TASKS, "tasks")
 
     def get_calibrations(self) -> Optional[list]:
         """Get list of available calibration plugins (ICalibration)."""
-        from .messages import ResourceCode
         return self._get_plugins_by_type(ResourceCode.AVAILABLE_CALIBRATIONS, "calibrations")
 
     def get_filters(self) -> Optional[list]:
         """Get list of available filter plugins (IFilter)."""
-        from .messages import ResourceCode
         return self._get_plugins_by_type(ResourceCode.AVAILABLE_FILTERS, "filters")
 
     def get_monitors(self) -> Optional[list]:
@@ -285,29 +430,94 @@ class ReyerClient:
             List of MonitorInfo objects, or None if request failed
         """
         try:
-            from .messages import ResourceRequest, ResourceCode, Response, MonitorInfo
-
             request = ResourceRequest(resource_code=ResourceCode.AVAILABLE_MONITORS)
             response_data = self.send_request(request)
 
             if response_data:
                 response = deserialize_message(response_data, Response)
                 if response.success and response.payload:
-                    monitors = msgspec.json.decode(response.payload, type=List[MonitorInfo])
+                    monitors = self._decode_resource_list(
+                        ResourceCode.AVAILABLE_MONITORS, response.payload
+                    )
 
-                    logger.info(f"Received {len(monitors)} monitors from server")
+                    logger.info("Received %d monitors from server", len(monitors))
                     return monitors
                 else:
-                    logger.error(f"Server returned error: {response.error_message}")
+                    logger.error("Server returned error: %s", response.error_message)
                     return None
             return None
-        except Exception as e:
-            logger.error(f"Failed to get monitors: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Failed to get monitors")
             return None
 
 
+    def get_resources(self, resource_codes: list[int]) -> Optional[dict[int, Optional[list]]]:
+        """
+        Get several list resources (monitors and plugins) in a single round trip.
+
+        Args:
+            resource_codes: ResourceCode values of list resources
+                (AVAILABLE_MONITORS or any AVAILABLE_* plugin type)
+
+        Returns:
+            Dict mapping each code to its decoded list (None for any the
+            server failed to provide), or None if request failed
+        """
+        try:
+            request = ResourceBatchRequest(resource_codes=list(resource_codes))
+            response_data = self.send_request(request)
+
+            if response_data:
+                response = deserialize_message(response_data, Response)
+                if response.success and response.payload:
+                    results = _RESPONSE_LIST_DECODER.decode(response.payload)
+                    if len(results) != len(request.resource_codes):
+                        logger.error(
+                            "Server answered %d of %d resources",
+                            len(results), len(request.resource_codes),
+                        )
+                    resources = {}
+                    for index, code in enumerate(request.resource_codes):
+                        # Codes the server left unanswered count as failed
+                        result = results[index] if index < len(results) else None
+                        if result is None:
+                            resources[code] = None
+                        elif result.success and result.payload:
+                            resources[code] = self._decode_resource_list(code, result.payload)
+                        else:
+                            logger.error("Server returned error for resource %s: %s", code, result.error_message)
+                            resources[code] = None
+                    logger.info("Received %d resources from server", len(resources))
+                    return resources
+                else:
+                    logger.error("Server returned error: %s", response.error_message)
+                    return None
+            return None
+        except Exception:
+            logger.exception("Failed to get resources")
+            return None
+
+    def get_launcher_bundle(self) -> Optional[dict]:
+        """
+        Get monitors and pipeline plugins in a single round trip.
+
+        Returns:
+            Dict with 'monitors', 'sources', 'stages', 'calibrations' and
+            'filters' lists (None for any the server failed to provide),
+            or None if request failed
+        """
+        fields = {
+            "monitors": ResourceCode.AVAILABLE_MONITORS,
+            "sources": ResourceCode.AVAILABLE_SOURCES,
+            "stages": ResourceCode.AVAILABLE_STAGES,
+            "calibrations": ResourceCode.AVAILABLE_CALIBRATIONS,
+            "filters": ResourceCode.AVAILABLE_FILTERS,
+        }
+        resources = self.get_resources(list(fields.values()))
+        if resources is None:
+            return None
+        return {name: resources.get(code) for name, code in fields.items()}
+
     def send_pipeline_config(
         self,
         source: str,
@@ -328,8 +538,6 @@ class ReyerClient:
             True if config was sent and accepted successfully
         """
         try:
-            from .messages import PipelineConfigRequest, Response
-
             request = PipelineConfigRequest(
                 pipeline_source=source,
                 pipeline_calibration=calibration,
@@ -343,11 +551,11 @@ class ReyerClient:
                     logger.info("Pipeline config sent successfully")
                     return True
                 else:
-                    logger.error(f"Server rejected pipeline config: {response.error_message}")
+                    logger.error("Server rejected pipeline config: %s", response.error_message)
                     return False
             return False
         except Exception as e:
-            logger.error(f"Failed to send pipeline config: {e}")
+            logger.error("Failed to send pipeline config: %s", e)
             return False
 
     def send_protocol(self, protocol) -> bool:
@@ -360,26 +568,34 @@ class ReyerClient:
         Returns:
             True if protocol was sent and accepted successfully, False otherwise
         """
-        try:
-            from .messages import Response
+        return self.send_encoded_protocol(serialize_message(protocol))
 
-            response_data = self.send_request(protocol)
+    def send_encoded_protocol(self, data: bytes) -> bool:
+        """
+        Send an already serialized protocol to reyer_rt for execution.
+
+        Args:
+            data: ProtocolRequest serialized with serialize_message
+
+        Returns:
+            True if protocol was sent and accepted successfully, False otherwise
+        """
+        try:
+            response_data = self.send_encoded_request(data)
 
             if response_data:
                 response = deserialize_message(response_data, Response)
                 if response.success:
-                    logger.info(f"Protocol '{protocol.name}' sent successfully")
+                    logger.info("Protocol sent successfully")
                     return True
                 else:
-                    logger.error(f"Server rejected protocol: {response.error_message}")
+                    logger.error("Server rejected protocol: %s", response.error_message)
                     return False
             else:
                 logger.error("No response received from server")
                 return False
-        except Exception as e:
-            logger.error(f"Failed to send protocol: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Failed to send protocol")
             return False
 
     def send_command(self, command: int, origin: str = "client", destination: str = "graphics") -> bool:
@@ -395,8 +611,6 @@ class ReyerClient:
             True if command was sent and accepted successfully, False otherwise
         """
         try:
-            from .messages import CommandRequest, Response
-
             cmd_request = CommandRequest(
                 command=command,
                 origin=origin,
@@ -407,18 +621,16 @@ class ReyerClient:
             if response_data:
                 response = deserialize_message(response_data, Response)
                 if response.success:
-                    logger.info(f"Command {command} sent successfully")
+                    logger.info("Command %s sent successfully", command)
                     return True
                 else:
-                    logger.error(f"Server rejected command: {response.error_message}")
+                    logger.error("Server rejected command: %s", response.error_message)
                     return False
             else:
                 logger.error("No response received from server")
                 return False
-        except Exception as e:
-            logger.error(f"Failed to send command: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Failed to send command")
             return False
 
     def get_runtime_state(self) -> Optional[int]:
@@ -429,8 +641,6 @@ class ReyerClient:
             RuntimeState enum value, or None if request failed
         """
         try:
-            from .messages import ResourceRequest, ResourceCode, Response, RuntimeState
-
             request = ResourceRequest(resource_code=ResourceCode.RUNTIME_STATE)
             response_data = self.send_request(request)
 
@@ -440,7 +650,7 @@ class ReyerClient:
                     return RuntimeState(int(response.payload))
             return None
         except Exception as e:
-            logger.error(f"Failed to get runtime state: {e}")
+            logger.error("Failed to get runtime state: %s", e)
             return None
 
     def send_graphics_settings(self, settings) -> bool:
@@ -454,8 +664,6 @@ class ReyerClient:
             True if settings were sent and accepted successfully, False otherwise
         """
         try:
-            from .messages import Response
-
             response_data = self.send_request(settings)
             if response_data:
                 response = deserialize_message(response_data, Response)
@@ -463,11 +671,11 @@ class ReyerClient:
                     logger.info("Graphics settings sent successfully")
                     return True
                 else:
-                    logger.error(f"Server rejected: {response.error_message}")
+                    logger.error("Server rejected: %s", response.error_message)
                     return False
             return False
         except Exception as e:
-            logger.error(f"Failed to send graphics settings: {e}")
+            logger.error("Failed to send graphics settings: %s", e)
             return False
 
     def subscribe(self, callback: Optional[Callable[[bytes], None]] = None) -> bool:
@@ -481,38 +689,46 @@ class ReyerClient:
         Returns:
             True if subscription successful, False otherwise
         """
-        with self._lock:
-            try:
-                if self._sub_socket is None:
-                    self._sub_socket = pynng.Sub0()
-                    self._sub_socket.recv_timeout = self.config.receive_timeout_ms
-                    self._sub_socket.dial(self.config.pub_socket_addr)
+        with self._sub_lock:
+            return self._subscribe_locked("default", callback)
 
-                    # Subscribe to all messages
-                    self._sub_socket.subscribe(b"")
-                    logger.info(f"Subscribed to messages from {self.config.pub_socket_addr}")
-
-                if callback:
-                    # Store callback
-                    topic = "default"
-                    if topic not in self._subscription_callbacks:
-                        self._subscription_callbacks[topic] = []
-                    self._subscription_callbacks[topic].append(callback)
-
-                # Start subscription receive thread if not already running
-                if not self._running:
-                    self._running = True
-                    self._subscription_thread = threading.Thread(
-                        target=self._subscription_loop,
-                        daemon=True
-                    )
-                    self._subscription_thread.start()
-                    logger.debug("Started subscription receive thread")
+    def _subscribe_locked(self, topic_key: str, callback: Optional[Callable]) -> bool:
+        """Open the subscription if needed and store callback. Caller holds _sub_lock."""
+        try:
+            if self._sub_socket is None:
+                # No recv_timeout: the receive task waits until cancelled
+                self._sub_socket = pynng.Sub0()
+                self._sub_socket.dial(self.config.pub_socket_addr)
+
+                # Subscribe to all messages
+                self._sub_socket.subscribe(b"")
+                logger.info("Subscribed to messages from %s", self.config.pub_socket_addr)
+
+            if callback:
+                # Store callback
+                if topic_key not in self._subscription_callbacks:
+                    self._subscription_callbacks[topic_key] = []
+                self._subscription_callbacks[topic_key].append(callback)
+
+            # Start subscription receive thread if not already running
+            if not self._running:
+                self._running = True
+                self._sub_loop = asyncio.new_event_loop()
+                self._sub_task = self._sub_loop.create_task(
+                    self._receive_broadcasts(self._sub_socket)
+                )
+                self._subscription_thread = threading.Thread(
+                    target=self._subscription_loop,
+                    args=(self._sub_loop, self._sub_task),
+                    daemon=True
+                )
+                self._subscription_thread.start()
+                logger.debug("Started subscription receive thread")
 
-                return True
-            except Exception as e:
-                logger.error(f"Failed to subscribe: {e}")
-                return False
+            return True
+        except Exception as e:
+            logger.error("Failed to subscribe: %s", e)
+            return False
 
     def unsubscribe(self, callback: Optional[Callable] = None) -> None:
         """
@@ -521,7 +737,7 @@ class ReyerClient:
         Args:
             callback: If provided, remove specific callback. Otherwise remove all.
         """
-        with self._lock:
+        with self._sub_lock:
             topic = "default"
             if topic in self._subscription_callbacks:
                 if callback:
@@ -544,64 +760,81 @@ class ReyerClient:
         Returns:
             True if subscription successful
         """
-        with self._lock:
-            # Initialize subscription if not already done
-            if self._sub_socket is None:
-                if not self.subscribe():
-                    return False
-
+        with self._sub_lock:
             # Store callback under topic-specific key
-            topic_key = f"topic_{topic}"
-            if topic_key not in self._subscription_callbacks:
-                self._subscription_callbacks[topic_key] = []
-            self._subscription_callbacks[topic_key].append(callback)
+            if not self._subscribe_locked(f"topic_{topic}", callback):
+                return False
 
-            logger.info(f"Subscribed callback to topic {topic}")
+            logger.info("Subscribed callback to topic %s", topic)
             return True
 
-    def _subscription_loop(self) -> None:
-        """Internal thread loop for receiving published messages."""
+    def _subscription_loop(self, loop: asyncio.AbstractEventLoop, task: asyncio.Task) -> None:
+        """Internal thread running the subscription receive task until cancelled."""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop.close()
+
+    async def _receive_broadcasts(self, sub_socket: pynng.Sub0) -> None:
+        """Receive published messages and dispatch them to callbacks."""
         while self._running:
             try:
-                if self._sub_socket:
-                    message_data = self._sub_socket.recv()
-
-                    # Parse BroadcastMessage
-                    from .messages import BroadcastMessage, BroadcastTopic, ProtocolEventMessage
-
+                frames = [await sub_socket.arecv()]
+                # Drain whatever else already arrived so a burst is dispatched in one pass
+                while len(frames) < _BROADCAST_BATCH_MAX:
                     try:
-                        broadcast_msg = msgspec.json.decode(message_data, type=BroadcastMessage)
-
-                        # Route to topic-specific callbacks
-                        topic_key = f"topic_{broadcast_msg.topic}"
-                        callbacks = self._subscription_callbacks.get(topic_key, [])
-
-                        for callback in callbacks:
-                            try:
-                                # Parse payload based on topic
-                                if broadcast_msg.topic == BroadcastTopic.PROTOCOL:
-                                    event = msgspec.json.decode(broadcast_msg.payload, type=ProtocolEventMessage)
-                                    callback(event)
-                                # Add other topic handlers as needed
-                            except Exception as e:
-                                logger.error(f"Error in topic callback: {e}")
-
-                        # Also call legacy "default" callbacks with raw data for backward compatibility
-                        default_callbacks = self._subscription_callbacks.get("default", [])
-                        for callback in default_callbacks:
-                            try:
-                                callback(message_data)
-                            except Exception as e:
-                                logger.error(f"Error in default subscription callback: {e}")
-
-                    except Exception as e:
-                        logger.error(f"Error parsing broadcast message: {e}")
-
-            except pynng.Timeout:
-                continue
+                        frames.append(sub_socket.recv(block=False))
+                    except pynng.TryAgain:
+                        break
+            except pynng.Closed:
+                break
             except Exception as e:
                 if self._running:
-                    logger.error(f"Error in subscription loop: {e}")
+                    logger.error("Error in subscription loop: %s", e)
+                continue
+
+            self._dispatch_broadcasts(frames)
+
+    def _dispatch_broadcasts(self, frames: list[bytes]) -> None:
+        """Decode a batch of published messages and call the matching callbacks."""
+        # Snapshot once per batch; copy lists so a concurrent subscribe can't
+        # change them mid-loop
+        subscriptions = self._subscription_callbacks.copy()
+        default_callbacks = list(subscriptions.get("default", ()))
+        protocol_callbacks = list(subscriptions.get(f"topic_{BroadcastTopic.PROTOCOL}", ()))
+
+        for message_data in frames:
+            # Read only the topic, so frames nobody listens to skip the payload
+            try:
+                topic = _TOPIC_DECODER.decode(message_data).topic
+            except Exception as e:
+                logger.error("Error parsing broadcast message: %s", e)
+                continue
+
+            # Route to topic-specific callbacks, parsing the payload once for all of them
+            if topic == BroadcastTopic.PROTOCOL and protocol_callbacks:
+                try:
+                    broadcast_msg = _BROADCAST_DECODER.decode(message_data)
+                    event = _PROTOCOL_EVENT_DECODER.decode(broadcast_msg.payload)
+                except Exception as e:
+                    logger.error("Error parsing topic payload: %s", e)
+                else:
+                    for callback in protocol_callbacks:
+                        try:
+                            callback(event)
+                        except Exception as e:
+                            logger.error("Error in topic callback: %s", e)
+            # Add other topic handlers as needed
+
+            # Also call legacy "default" callbacks with raw data for backward compatibility
+            for callback in default_callbacks:
+                try:
+                    callback(message_data)
+                except Exception as e:
+                    logger.error("Error in default subscription callback: %s", e)
 
     def __enter__(self) -> ReyerClient:
         """Context manager entry."""
@@ -4,7 +4,7 @@ import logging
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QStackedWidget,
-    QPushButton, QLabel, QMessageBox
+    QPushButton, QLabel, QMessageBox, QWidget
 )
 from PySide6.QtCore import Qt
 
@@ -12,6 +12,7 @@ from .client import ReyerClient
 from .messages import GraphicsSettingsRequest, MonitorInfo, PluginInfo
 from .pages.graphics_settings_page import GraphicsSettingsPage
 from .pages.pipeline_config_page import PipelineConfigPage
+from .widgets import heading_label
 
 logger = logging.getLogger(__name__)
 
@@ -54,8 +55,7 @@ class LauncherDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Title
-        title = QLabel("<h1>Reyer RT — Launcher</h1>")
-        title.setTextFormat(Qt.RichText)
+        title = heading_label("Reyer RT — Launcher", 2.0)
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
 
@@ -70,13 +70,18 @@ class LauncherDialog(QDialog):
         self.graphics_page = GraphicsSettingsPage(self.monitors)
         self.stacked_widget.addWidget(self.graphics_page)
 
-        self.pipeline_page = PipelineConfigPage(
-            self.sources, self.stages, self.calibrations, self.filters
-        )
-        self.stacked_widget.addWidget(self.pipeline_page)
+        # The pipeline page is built when the user reaches it; hold its slot
+        self.pipeline_page: PipelineConfigPage | None = None
+        self.stacked_widget.addWidget(QWidget())
 
         layout.addWidget(self.stacked_widget, 1)
 
+        # Page indicator base text for each step
+        total = self.stacked_widget.count()
+        self._indicator_texts = tuple(
+            f"Step {index + 1} of {total}" for index in range(total)
+        )
+
         # Navigation buttons (no cancel)
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -92,15 +97,27 @@ class LauncherDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+        self._update_ui()
+
+    def _ensure_pipeline_page(self):
+        """Build the pipeline page in place of its placeholder on first use."""
+        if self.pipeline_page is not None:
+            return
+
+        self.pipeline_page = PipelineConfigPage(
+            self.sources, self.stages, self.calibrations, self.filters
+        )
+        placeholder = self.stacked_widget.widget(self.PAGE_PIPELINE)
+        self.stacked_widget.insertWidget(self.PAGE_PIPELINE, self.pipeline_page)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+
         # Re-validate when page content changes
         self.pipeline_page.content_changed.connect(self._update_ui)
 
-        self._update_ui()
-
     def _update_ui(self):
         current = self.stacked_widget.currentIndex()
-        total = self.stacked_widget.count()
-        self.page_indicator.setText(f"Step {current + 1} of {total}")
+        indicator = self._indicator_texts[current]
 
         is_graphics = current == self.PAGE_GRAPHICS
         self.next_button.setVisible(is_graphics)
@@ -113,9 +130,10 @@ class LauncherDialog(QDialog):
             self.next_button.setEnabled(is_valid)
             self.launch_button.setEnabled(is_valid)
             if not is_valid and error_msg:
-                self.page_indicator.setText(
-                    f"Step {current + 1} of {total} — {error_msg}"
-                )
+                indicator = f"{indicator} — {error_msg}"
+
+        # Set once; QLabel ignores a repeat of its current text
+        self.page_indicator.setText(indicator)
 
     def _on_next(self):
         """Validate graphics settings, send them, and move to pipeline page."""
@@ -137,6 +155,7 @@ class LauncherDialog(QDialog):
             return
 
         self.settings_result = settings
+        self._ensure_pipeline_page()
         self.stacked_widget.setCurrentIndex(self.PAGE_PIPELINE)
         self._update_ui()
 
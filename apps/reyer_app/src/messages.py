@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import msgspec
+from functools import lru_cache
 from typing import List
-from enum import IntEnum
+from enum import IntEnum, unique
 
 
-class Message(msgspec.Struct):
-    """Base message class for all IPC messages."""
-    pass
+class Message(msgspec.Struct, frozen=True, gc=False):
+    """Base message class for all IPC messages.
+
+    Messages are immutable records holding only scalars, strings and lists
+    of other messages, so they can't form reference cycles and skip GC
+    tracking. Subclasses inherit both options.
+    """
 
 
 class Ping(Message):
@@ -34,6 +39,7 @@ class Response(Message):
     payload: str = ""
 
 
+@unique
 class ResourceCode(IntEnum):
     """Resource type codes for ResourceRequest."""
     RUNTIME_STATE = 0
@@ -48,6 +54,7 @@ class ResourceCode(IntEnum):
     AVAILABLE_CALIBRATIONS = 9
     AVAILABLE_FILTERS = 10
 
+@unique
 class RuntimeState(IntEnum):
     """Runtime state values."""
     DEFAULT = 0
@@ -55,6 +62,7 @@ class RuntimeState(IntEnum):
     RUNNING = 2
     SAVING = 3
 
+@unique
 class Command(IntEnum):
     """Commands for the graphics manager"""
     START = 0
@@ -64,11 +72,13 @@ class Command(IntEnum):
     RESTART = 4
     EXIT = 5
 
+@unique
 class BroadcastTopic(IntEnum):
     """Broadcast message topic types."""
     LOG = 0
     PROTOCOL = 1
 
+@unique
 class ProtocolEvent(IntEnum):
     """Protocol lifecycle events."""
     GRAPHICS_READY = 0
@@ -99,6 +109,11 @@ class ResourceRequest(Message):
     resource_code: int
 
 
+class ResourceBatchRequest(Message):
+    """Request for several resources in a single round trip."""
+    resource_codes: List[int]
+
+
 class PluginInfo(Message):
     """Plugin information message."""
     name: str
@@ -150,16 +165,26 @@ class PipelineConfigRequest(Message):
 # Type alias for any message variant
 MessageType = (
     Ping | Pong | GraphicsSettingsRequest | ProtocolRequest |
-    PipelineConfigRequest | Response | ResourceRequest | PluginInfo |
+    PipelineConfigRequest | Response | ResourceRequest |
+    ResourceBatchRequest | PluginInfo |
     MonitorInfo | CommandRequest
 )
 
 
+_ENCODER = msgspec.json.Encoder()
+
+
+@lru_cache(maxsize=64)
+def get_decoder(msg_type) -> msgspec.json.Decoder:
+    """Return a shared JSON decoder for msg_type (any msgspec-supported type)."""
+    return msgspec.json.Decoder(msg_type)
+
+
 def serialize_message(msg: Message) -> bytes:
     """Serialize a message to JSON format."""
-    return msgspec.json.encode(msg)
+    return _ENCODER.encode(msg)
 
 
 def deserialize_message(data: bytes, msg_type: type[Message]) -> Message:
     """Deserialize JSON data to a message object."""
-    return msgspec.json.decode(data, type=msg_type)
+    return get_decoder(msg_type).decode(data)
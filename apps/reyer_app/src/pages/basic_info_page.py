@@ -3,7 +3,9 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QLineEdit, QTextEdit, QLabel
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QTimer, Signal
+
+from ..widgets import heading_label
 
 
 class BasicInfoPage(QWidget):
@@ -11,6 +13,10 @@ class BasicInfoPage(QWidget):
 
     content_changed = Signal()
 
+    # Typing pause before content_changed fires, so a burst of keystrokes
+    # triggers one validation pass; validity changes are sent immediately
+    CONTENT_CHANGED_DELAY_MS = 80
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._init_ui()
@@ -18,17 +24,40 @@ class BasicInfoPage(QWidget):
 
     def _connect_signals(self):
         """Connect input field signals to emit content_changed."""
-        self.name_input.textChanged.connect(lambda: self.content_changed.emit())
-        self.participant_id_input.textChanged.connect(lambda: self.content_changed.emit())
-        self.notes_input.textChanged.connect(lambda: self.content_changed.emit())
+        self._content_timer = QTimer(self)
+        self._content_timer.setSingleShot(True)
+        self._content_timer.setInterval(self.CONTENT_CHANGED_DELAY_MS)
+        self._content_timer.timeout.connect(self._emit_content_changed)
+
+        # Validity last reported to listeners (fields start empty)
+        self._reported_valid = False
+
+        # Notes never affect validity, so its edits are only debounced
+        self.name_input.textChanged.connect(self._on_required_field_changed)
+        self.participant_id_input.textChanged.connect(self._on_required_field_changed)
+        self.notes_input.textChanged.connect(self._content_timer.start)
+
+    def _on_required_field_changed(self, *_):
+        """Emit content_changed now if validity flipped, else debounce it."""
+        is_valid, _ = self.is_valid()
+        if is_valid != self._reported_valid:
+            # Listeners enable Next/Finish from this, so it can't lag the fields
+            self._content_timer.stop()
+            self._emit_content_changed()
+        else:
+            self._content_timer.start()
+
+    def _emit_content_changed(self):
+        """Notify listeners and remember the validity they will see."""
+        self._reported_valid = self.is_valid()[0]
+        self.content_changed.emit()
 
     def _init_ui(self):
         """Initialize the UI."""
         layout = QVBoxLayout(self)
 
         # Page title
-        title = QLabel("<h2>Protocol Information</h2>")
-        title.setTextFormat(Qt.RichText)
+        title = heading_label("Protocol Information")
         layout.addWidget(title)
 
         # Description
@@ -82,12 +111,12 @@ class BasicInfoPage(QWidget):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        data = self.get_data()
-
-        if not data['name']:
+        # Only the required fields; notes would mean serializing the whole
+        # QTextEdit document on every check
+        if not self.name_input.text().strip():
             return False, "Protocol name is required"
 
-        if not data['participant_id']:
+        if not self.participant_id_input.text().strip():
             return False, "Participant ID is required"
 
         return True, ""
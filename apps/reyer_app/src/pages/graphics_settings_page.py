@@ -5,9 +5,9 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QComboBox, QCheckBox,
     QSpinBox, QLabel, QLineEdit, QHBoxLayout
 )
-from PySide6.QtCore import Qt
 
 from ..messages import MonitorInfo, GraphicsSettings
+from ..widgets import heading_label
 
 
 class GraphicsSettingsPage(QWidget):
@@ -30,8 +30,7 @@ class GraphicsSettingsPage(QWidget):
         layout = QVBoxLayout(self)
 
         # Page title
-        title = QLabel("<h2>Graphics Settings</h2>")
-        title.setTextFormat(Qt.RichText)
+        title = heading_label("Graphics Settings")
         layout.addWidget(title)
 
         # Description
@@ -7,6 +7,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal
 
 from ..messages import PluginInfo
+from ..widgets import heading_label
 
 
 class PipelineConfigPage(QWidget):
@@ -32,8 +33,7 @@ class PipelineConfigPage(QWidget):
     def _init_ui(self):
         layout = QVBoxLayout(self)
 
-        title = QLabel("<h2>Pipeline Configuration</h2>")
-        title.setTextFormat(Qt.RichText)
+        title = heading_label("Pipeline Configuration")
         layout.addWidget(title)
 
         description = QLabel(
@@ -7,6 +7,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from ..schema_ui import PluginConfigWidget
+from ..widgets import heading_label
 
 
 class TaskConfigurationPage(QWidget):
@@ -30,8 +31,7 @@ class TaskConfigurationPage(QWidget):
         layout = QVBoxLayout(self)
 
         # Page title
-        title = QLabel("<h2>Task Configuration</h2>")
-        title.setTextFormat(Qt.RichText)
+        title = heading_label("Task Configuration")
         layout.addWidget(title)
 
         # Description
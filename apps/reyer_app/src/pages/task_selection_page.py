@@ -7,6 +7,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal
 
 from ..messages import PluginInfo
+from ..widgets import heading_label
 
 
 class TaskSelectionPage(QWidget):
@@ -32,8 +33,7 @@ class TaskSelectionPage(QWidget):
         layout = QVBoxLayout(self)
 
         # Page title
-        title = QLabel("<h2>Task Selection</h2>")
-        title.setTextFormat(Qt.RichText)
+        title = heading_label("Task Selection")
         layout.addWidget(title)
 
         # Description
@@ -12,8 +12,9 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from .client import ReyerClient
-from .messages import PluginInfo, MonitorInfo, ProtocolRequest, TaskInfo
+from .messages import PluginInfo, MonitorInfo, ProtocolRequest, ResourceCode, TaskInfo
 from .pages import BasicInfoPage, TaskSelectionPage, TaskConfigurationPage
+from .widgets import heading_label
 
 logger = logging.getLogger(__name__)
 
@@ -52,20 +53,40 @@ class ProtocolBuilderDialog(QDialog):
         self.setWindowTitle("Protocol Builder")
         self.setMinimumSize(800, 600)
 
+    @property
+    def has_resources(self) -> bool:
+        """Whether monitors and task plugins were fetched from the server."""
+        return bool(self.monitors and self.plugins)
+
+    def reset(self):
+        """Clear the entered protocol, keeping the fetched resources."""
+        self.protocol_result = None
+        if not self.has_resources:
+            return
+
+        self.basic_info_page.set_data({})
+        self.task_selection_page.set_tasks([])
+        self._remove_task_config_page()
+        self.stacked_widget.setCurrentIndex(self.PAGE_BASIC_INFO)
+        self._update_navigation_buttons()
+
     def _fetch_resources(self):
         """Fetch monitors and plugins from server."""
         logger.info("Fetching monitors and plugins from server...")
 
-        # Fetch monitors
-        monitors = self.client.get_monitors()
+        # Fetch monitors and tasks (IRender plugins) in one round trip
+        resources = self.client.get_resources(
+            [ResourceCode.AVAILABLE_MONITORS, ResourceCode.AVAILABLE_TASKS]
+        ) or {}
+
+        monitors = resources.get(ResourceCode.AVAILABLE_MONITORS)
         if monitors:
             self.monitors = monitors
             logger.info(f"Fetched {len(monitors)} monitor(s)")
         else:
             logger.warning("Failed to fetch monitors or no monitors available")
 
-        # Fetch tasks (IRender plugins)
-        tasks = self.client.get_tasks()
+        tasks = resources.get(ResourceCode.AVAILABLE_TASKS)
         if tasks:
             self.plugins = tasks
             logger.info(f"Fetched {len(tasks)} task(s)")
@@ -77,7 +98,7 @@ class ProtocolBuilderDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Check if we have the required resources
-        if not self.monitors or not self.plugins:
+        if not self.has_resources:
             error_msg = []
             if not self.monitors:
                 error_msg.append("• No monitors available")
@@ -102,8 +123,7 @@ class ProtocolBuilderDialog(QDialog):
             return
 
         # Title
-        title = QLabel("<h1>Protocol Builder</h1>")
-        title.setTextFormat(Qt.RichText)
+        title = heading_label("Protocol Builder", 2.0)
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
 
@@ -240,10 +260,7 @@ class ProtocolBuilderDialog(QDialog):
         logger.info("_generate_task_config_pages called")
 
         # Remove existing task config page if it exists
-        if self.task_config_page:
-            self.stacked_widget.removeWidget(self.task_config_page)
-            self.task_config_page.deleteLater()
-            self.task_config_page = None
+        self._remove_task_config_page()
 
         # Get selected tasks
         tasks = self.task_selection_page.get_tasks()
@@ -258,6 +275,13 @@ class ProtocolBuilderDialog(QDialog):
         else:
             logger.warning("No tasks selected, skipping task config page creation")
 
+    def _remove_task_config_page(self):
+        """Remove the task configuration page, if one was generated."""
+        if self.task_config_page:
+            self.stacked_widget.removeWidget(self.task_config_page)
+            self.task_config_page.deleteLater()
+            self.task_config_page = None
+
     def _on_finish(self):
         """Handle finish button click."""
         # Validate current page
@@ -337,7 +361,7 @@ class ProtocolBuilderDialog(QDialog):
             ProtocolRequest object if dialog accepted, None if cancelled or resources unavailable
         """
         # Check if resources were successfully loaded
-        if not self.monitors or not self.plugins:
+        if not self.has_resources:
             logger.error("Cannot build protocol: resources unavailable")
             result = self.exec()  # Show error dialog
             return None
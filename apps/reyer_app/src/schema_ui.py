@@ -14,6 +14,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
+from .widgets import heading_label
+
 try:
     from jsonschema import validate, ValidationError, Draft7Validator
     JSONSCHEMA_AVAILABLE = True
@@ -439,8 +441,7 @@ class PluginConfigWidget(QWidget):
         layout = QVBoxLayout(self)
 
         # Plugin title
-        title = QLabel(f"<h2>{self.plugin_name} Configuration</h2>")
-        title.setTextFormat(Qt.RichText)
+        title = heading_label(f"{self.plugin_name} Configuration")
         layout.addWidget(title)
 
         # Schema description if available
@@ -0,0 +1,29 @@
+"""Small widget helpers shared by the app's dialogs and pages."""
+
+from PySide6.QtWidgets import QLabel
+
+
+def heading_label(text: str, scale: float = 1.5) -> QLabel:
+    """
+    Create a bold plain-text heading.
+
+    Styled through the label font instead of <h1>/<h2> markup, so Qt never
+    runs its rich text parser for it.
+
+    Args:
+        text: Heading text (shown literally)
+        scale: Font size relative to the default; 2.0 matches <h1>, 1.5 <h2>
+
+    Returns:
+        The heading label
+    """
+    label = QLabel(text)
+    font = label.font()
+    # pointSizeF() is -1 for pixel-sized fonts, so scale whichever is set
+    if font.pointSizeF() > 0:
+        font.setPointSizeF(font.pointSizeF() * scale)
+    else:
+        font.setPixelSize(round(font.pixelSize() * scale))
+    font.setBold(True)
+    label.setFont(font)
+    return label
@@ -0,0 +1,83 @@
+"""Tests for ReyerClient response decoding (no server needed)."""
+
+import unittest
+from unittest import mock
+
+import msgspec
+
+from src.client import ReyerClient
+from src.messages import MonitorInfo, PluginInfo, ResourceCode, Response
+
+MONITORS = ResourceCode.AVAILABLE_MONITORS
+TASKS = ResourceCode.AVAILABLE_TASKS
+
+MONITOR = MonitorInfo(
+    index=0, width_px=1920, height_px=1080, width_mm=530, height_mm=300,
+    refresh_rate=60, name="DP-1",
+)
+TASK = PluginInfo(name="fixation", configuration_schema="{}")
+
+
+def _entry(items=None, error: str = "") -> Response:
+    """One inner Response of a batch payload."""
+    if items is None:
+        return Response(success=False, error_code=11, error_message=error)
+    return Response(success=True, payload=msgspec.json.encode(items).decode())
+
+
+def _batch_reply(entries: list[Response], success: bool = True) -> bytes:
+    """Encoded outer Response carrying entries as its payload."""
+    payload = msgspec.json.encode(entries).decode() if success else ""
+    return msgspec.json.encode(
+        Response(success=success, error_message="" if success else "bad batch", payload=payload)
+    )
+
+
+class GetResourcesTests(unittest.TestCase):
+
+    def setUp(self):
+        self.client = ReyerClient()
+
+    def _get_resources(self, reply, codes=(MONITORS, TASKS)):
+        with mock.patch.object(self.client, "send_request", return_value=reply):
+            return self.client.get_resources(list(codes))
+
+    def test_mixed_success_and_failure(self):
+        resources = self._get_resources(_batch_reply([
+            _entry([MONITOR]), _entry(error="Resource temporarily unavailable"),
+        ]))
+        self.assertEqual(resources, {MONITORS: [MONITOR], TASKS: None})
+
+    def test_decodes_by_resource_type(self):
+        resources = self._get_resources(_batch_reply([_entry([MONITOR]), _entry([TASK])]))
+        self.assertIsInstance(resources[MONITORS][0], MonitorInfo)
+        self.assertIsInstance(resources[TASKS][0], PluginInfo)
+        self.assertEqual(resources[TASKS], [TASK])
+
+    def test_success_without_payload_is_none(self):
+        resources = self._get_resources(_batch_reply([Response(success=True), _entry([TASK])]))
+        self.assertEqual(resources, {MONITORS: None, TASKS: [TASK]})
+
+    def test_fewer_results_than_codes(self):
+        resources = self._get_resources(_batch_reply([_entry([MONITOR])]))
+        self.assertEqual(resources, {MONITORS: [MONITOR], TASKS: None})
+
+    def test_more_results_than_codes(self):
+        resources = self._get_resources(
+            _batch_reply([_entry([MONITOR]), _entry([TASK])]), codes=(MONITORS,)
+        )
+        self.assertEqual(resources, {MONITORS: [MONITOR]})
+
+    def test_outer_failure_is_none(self):
+        self.assertIsNone(self._get_resources(_batch_reply([], success=False)))
+
+    def test_no_reply_is_none(self):
+        self.assertIsNone(self._get_resources(None))
+
+    def test_malformed_payload_is_none(self):
+        reply = msgspec.json.encode(Response(success=True, payload="not json"))
+        self.assertIsNone(self._get_resources(reply))
+
+
+if __name__ == "__main__":
+    unittest.main()
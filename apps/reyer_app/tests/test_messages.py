@@ -0,0 +1,45 @@
+"""Wire encoding tests for message types shared with reyer_rt."""
+
+import unittest
+
+from src.messages import (
+    ResourceBatchRequest, ResourceCode, ResourceRequest, Response,
+    deserialize_message, get_decoder, serialize_message,
+)
+
+# Same JSON as apps/reyer_rt/tests/test_resource_batch.cpp
+BATCH_JSON = b'{"resource_codes":[1,5]}'
+
+
+class ResourceBatchRequestTests(unittest.TestCase):
+
+    def test_encodes_to_server_json(self):
+        request = ResourceBatchRequest(resource_codes=[
+            ResourceCode.AVAILABLE_MONITORS, ResourceCode.AVAILABLE_TASKS,
+        ])
+        self.assertEqual(serialize_message(request), BATCH_JSON)
+
+    def test_round_trip(self):
+        request = deserialize_message(BATCH_JSON, ResourceBatchRequest)
+        self.assertEqual(request.resource_codes, [1, 5])
+        self.assertEqual(serialize_message(request), BATCH_JSON)
+
+    def test_field_name_differs_from_single_request(self):
+        # reyer_rt picks the variant alternative by field name
+        single = serialize_message(ResourceRequest(resource_code=1))
+        self.assertEqual(single, b'{"resource_code":1}')
+        self.assertNotIn(b'"resource_code"', BATCH_JSON)
+
+    def test_decodes_batch_payload(self):
+        payload = (
+            b'[{"success":true,"error_code":0,"error_message":"","payload":"[]"},'
+            b'{"success":false,"error_code":11,'
+            b'"error_message":"Resource temporarily unavailable","payload":""}]'
+        )
+        results = get_decoder(list[Response]).decode(payload)
+        self.assertEqual([r.success for r in results], [True, False])
+        self.assertEqual(results[1].error_code, 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
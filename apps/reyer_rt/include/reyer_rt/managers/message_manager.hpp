@@ -23,6 +23,7 @@ class MessageManager : public threading::Thread<MessageManager> {
                      net::message::ProtocolRequest,
                      net::message::PipelineConfigRequest,
                      net::message::ResourceRequest,
+                     net::message::ResourceBatchRequest,
                      net::message::CommandRequest>;
 
   public:
@@ -83,6 +84,9 @@ class MessageManager : public threading::Thread<MessageManager> {
         std::expected<net::message::Response, std::error_code>
         operator()(const net::message::ResourceRequest &request);
 
+        std::expected<net::message::Response, std::error_code>
+        operator()(const net::message::ResourceBatchRequest &request);
+
         std::expected<net::message::Response, std::error_code>
         operator()(const net::message::PipelineConfigRequest &request);
 
@@ -113,6 +113,10 @@ struct ResourceRequest {
     ResourceCode resource_code;
 };
 
+struct ResourceBatchRequest {
+    std::vector<ResourceCode> resource_codes;
+};
+
 enum class RuntimeState : uint8_t {
     DEFAULT = 0,
     STANDBY = 1,
@@ -0,0 +1,31 @@
+#pragma once
+#include "reyer_rt/net/message_types.hpp"
+#include <expected>
+#include <system_error>
+#include <utility>
+#include <vector>
+
+namespace reyer_rt::net::message {
+
+// Answer each code of a batch in order. `answer` returns
+// std::expected<Response, std::error_code> for a single ResourceRequest; a
+// failed code becomes the entry built by `make_error`, so one unavailable
+// resource doesn't fail the whole batch.
+template <typename Answer, typename MakeError>
+std::vector<Response> CollectBatchResponses(const ResourceBatchRequest &request,
+                                            Answer &&answer,
+                                            MakeError &&make_error) {
+    std::vector<Response> responses;
+    responses.reserve(request.resource_codes.size());
+    for (auto code : request.resource_codes) {
+        auto result = answer(ResourceRequest{code});
+        if (result) {
+            responses.push_back(std::move(result.value()));
+        } else {
+            responses.push_back(make_error(result.error()));
+        }
+    }
+    return responses;
+}
+
+} // namespace reyer_rt::net::message
@@ -2,6 +2,7 @@
 #include "reyer_rt/experiment/protocol.hpp"
 #include "reyer_rt/managers/graphics_manager.hpp"
 #include "reyer_rt/net/message_types.hpp"
+#include "reyer_rt/net/resource_batch.hpp"
 #include "reyer_rt/utils/utils.hpp"
 #include "spdlog/spdlog.h"
 
@@ -145,6 +146,9 @@ MessageManager::SerializePayload(const std::vector<net::message::PluginInfo> &);
 template std::expected<std::string, std::error_code>
 MessageManager::SerializePayload(const net::message::GraphicsSettings &);
 
+template std::expected<std::string, std::error_code>
+MessageManager::SerializePayload(const std::vector<net::message::Response> &);
+
 std::expected<net::message::Response, std::error_code>
 MessageManager::BuildPluginInfoResponse(
     const std::vector<std::string> &plugin_names,
@@ -477,4 +481,23 @@ MessageManager::MessageVisitor::operator()(
     return std::unexpected(std::make_error_code(std::errc::invalid_argument));
 }
 
-} // namespace reyer_rt::managers
\ No newline at end of file
+std::expected<net::message::Response, std::error_code>
+MessageManager::MessageVisitor::operator()(
+    const net::message::ResourceBatchRequest &request) {
+
+    // Answer each code as if it had been requested on its own, in order
+    auto responses = net::message::CollectBatchResponses(
+        request,
+        [this](const net::message::ResourceRequest &single) {
+            return (*this)(single);
+        },
+        [this](std::error_code ec) { return manager.CreateErrorResponse(ec); });
+
+    auto payload = manager.SerializePayload(responses);
+    if (!payload) {
+        return std::unexpected(payload.error());
+    }
+    return manager.CreateSuccessResponse(std::move(payload.value()));
+}
+
+} // namespace reyer_rt::managers
@@ -0,0 +1,104 @@
+#include "reyer_rt/net/message_types.hpp"
+#include "reyer_rt/net/resource_batch.hpp"
+#include <glaze/glaze.hpp>
+#include <glaze/json/write.hpp>
+#include <glaze/json/read.hpp>
+#include <expected>
+#include <iostream>
+#include <string>
+#include <system_error>
+#include <variant>
+#include <vector>
+#include <cassert>
+
+namespace msg = reyer_rt::net::message;
+
+// Same alternatives, in the same order, as MessageManager::MessageVariant
+using MessageVariant = std::variant<
+    msg::Ping,
+    msg::GraphicsSettingsRequest,
+    msg::ProtocolRequest,
+    msg::PipelineConfigRequest,
+    msg::ResourceRequest,
+    msg::ResourceBatchRequest,
+    msg::CommandRequest
+>;
+
+// Sent by ReyerClient.get_resources for monitors + tasks (see the Python
+// messages test, which encodes the same JSON)
+constexpr std::string_view kBatchJson = R"({"resource_codes":[1,5]})";
+
+int main() {
+    std::cout << "=== Testing ResourceBatchRequest ===" << std::endl;
+
+    // Test 1: the batch request deduces to ResourceBatchRequest
+    std::cout << "\n[Test 1] Auto-deducing batch request..." << std::endl;
+    MessageVariant batch_variant;
+    auto err1 = glz::read_json(batch_variant, kBatchJson);
+    assert(!err1 && "Failed to read batch request into variant");
+    auto* batch = std::get_if<msg::ResourceBatchRequest>(&batch_variant);
+    assert(batch && "resource_codes should select ResourceBatchRequest");
+    assert(batch->resource_codes.size() == 2);
+    assert(batch->resource_codes[0] == msg::ResourceCode::AVAILABLE_MONITORS);
+    assert(batch->resource_codes[1] == msg::ResourceCode::AVAILABLE_TASKS);
+    std::cout << "  ✓ Deduced ResourceBatchRequest (index " << batch_variant.index() << ")" << std::endl;
+
+    // Test 2: a single request still deduces to ResourceRequest
+    std::cout << "\n[Test 2] Auto-deducing single resource request..." << std::endl;
+    MessageVariant single_variant;
+    auto err2 = glz::read_json(single_variant, std::string_view{R"({"resource_code":1})"});
+    assert(!err2 && "Failed to read resource request into variant");
+    auto* single = std::get_if<msg::ResourceRequest>(&single_variant);
+    assert(single && "resource_code should select ResourceRequest");
+    assert(single->resource_code == msg::ResourceCode::AVAILABLE_MONITORS);
+    std::cout << "  ✓ Deduced ResourceRequest (index " << single_variant.index() << ")" << std::endl;
+
+    // Test 3: each code is answered in order; failures become error entries
+    std::cout << "\n[Test 3] Collecting batch responses..." << std::endl;
+    msg::ResourceBatchRequest request{{
+        msg::ResourceCode::AVAILABLE_MONITORS,
+        msg::ResourceCode::AVAILABLE_SINKS,
+        msg::ResourceCode::AVAILABLE_TASKS,
+    }};
+    const auto unavailable = std::make_error_code(std::errc::resource_unavailable_try_again);
+    auto responses = msg::CollectBatchResponses(
+        request,
+        [&](const msg::ResourceRequest& single_request)
+            -> std::expected<msg::Response, std::error_code> {
+            if (single_request.resource_code == msg::ResourceCode::AVAILABLE_SINKS) {
+                return std::unexpected(unavailable);
+            }
+            return msg::Response{.success = true, .payload = "[]"};
+        },
+        [](std::error_code ec) {
+            return msg::Response{.success = false,
+                                 .error_code = ec.value(),
+                                 .error_message = ec.message()};
+        });
+    assert(responses.size() == 3 && "One entry per requested code");
+    assert(responses[0].success && responses[0].payload == "[]");
+    assert(!responses[1].success && "Failed code should become an error entry");
+    assert(responses[1].error_code == unavailable.value());
+    assert(responses[1].error_message == unavailable.message());
+    assert(responses[1].payload.empty());
+    assert(responses[2].success && "A failed code must not stop later codes");
+    std::cout << "  ✓ 3 entries, error entry at index 1" << std::endl;
+
+    // Test 4: the payload is a JSON array of Response objects
+    std::cout << "\n[Test 4] Serializing batch payload..." << std::endl;
+    std::string payload;
+    auto err4 = glz::write_json(responses, payload);
+    assert(!err4 && "Failed to serialize batch payload");
+    assert(payload.starts_with(R"([{"success":true,"error_code":0,"error_message":"","payload":"[]"})"));
+    std::cout << "  Payload: " << payload << std::endl;
+
+    std::vector<msg::Response> decoded;
+    auto err5 = glz::read_json(decoded, payload);
+    assert(!err5 && "Failed to read batch payload back");
+    assert(decoded.size() == responses.size());
+    assert(!decoded[1].success && decoded[1].error_code == unavailable.value());
+    std::cout << "  ✓ Payload round-trips as vector<Response>" << std::endl;
+
+    std::cout << "\n=== All ResourceBatchRequest tests passed ===" << std::endl;
+    return 0;
+}